@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
+import functools
 import os
-import shutil
+import re
 import sys
 from pathlib import Path
-from typing import Annotated, Optional
+from types import MappingProxyType
+from typing import Mapping
 
-from verification import verify_skill_directory
+__version__ = "0.1.0"
 
 
 def _load_typer():
+    global typer
     try:
         import typer as _typer  # type: ignore
     except Exception:
@@ -21,102 +23,293 @@ def _load_typer():
             file=sys.stderr,
         )
         raise SystemExit(1)
+    typer = _typer
     return _typer
 
 
-# Perform the Typer availability check first, before defining the CLI.
-typer = _load_typer()
+def _bad_parameter(message: str) -> Exception:
+    # The module-level `__getattr__` does not serve global lookups here, so load Typer explicitly.
+    return _load_typer().BadParameter(message)
 
-app = typer.Typer(add_completion=False, help="Skills registry CLI (Typer)")
 
-HOME = Path.home()
-REGISTRY_ROOT = HOME / "skills"
-REGISTRY_SKILLS_DIR = REGISTRY_ROOT / "skills"
-BUILDER_PROMPT_PATH = REGISTRY_ROOT / "skill.build"
-IMPROVE_PROMPT_PATH = REGISTRY_ROOT / "skill.improve"
+def __getattr__(name: str):
+    # Typer and the app are loaded on first use so importing this module stays cheap.
+    if name == "typer":
+        return _load_typer()
+    if name == "app":
+        return _build_app()
+    if name in _LAZY_PATHS:
+        return _LAZY_PATHS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def home_str() -> str:
+    # Resolved on first use rather than at import (expanduser may consult the passwd db).
+    return os.path.expanduser("~")
+
+
+@functools.cache
+def registry_root_str() -> str:
+    return os.path.join(home_str(), "skills")
+
+
+@functools.cache
+def builder_prompt_path_str() -> str:
+    return os.path.join(registry_root_str(), "skill.build")
+
+
+@functools.cache
+def improve_prompt_path_str() -> str:
+    return os.path.join(registry_root_str(), "skill.improve")
+
+
+# Path variants for filesystem work; the `_str` getters above serve the print-only commands.
+@functools.cache
+def home_dir() -> Path:
+    return Path(home_str())
+
+
+@functools.cache
+def registry_root() -> Path:
+    return Path(registry_root_str())
+
+
+@functools.cache
+def registry_skills_dir() -> Path:
+    return registry_root() / "skills"
+
+
+@functools.cache
+def builder_prompt_path() -> Path:
+    return Path(builder_prompt_path_str())
+
+
+@functools.cache
+def improve_prompt_path() -> Path:
+    return Path(improve_prompt_path_str())
+
+
+# Former module constants, still reachable as attributes (e.g. `cli.REGISTRY_ROOT`).
+_LAZY_PATHS = {
+    "HOME": home_dir,
+    "REGISTRY_ROOT": registry_root,
+    "REGISTRY_SKILLS_DIR": registry_skills_dir,
+    "BUILDER_PROMPT_PATH": builder_prompt_path,
+    "IMPROVE_PROMPT_PATH": improve_prompt_path,
+}
 AGENTS = ("codex", "claude", "kiro", "gemini", "antigravity")
+_AGENTS_SET = frozenset(AGENTS)
+_WHITESPACE_DROP = str.maketrans("", "", " \t\n\r\f\v")
 
 
 def expand_home(value: str | None) -> Path | None:
-    if value is None:
-        return None
-    return Path(os.path.expanduser(value)).resolve()
+    # Purely lexical: callers that need an absolute path resolve it themselves.
+    return None if value is None else Path(value).expanduser()
+
+
+def _absolute(path: Path) -> Path:
+    # Absolute input skips the realpath() walk but is still normalized, so a `..` component
+    # never ends up as a `.name` or gets joined under the registry.
+    return Path(os.path.normpath(path)) if path.is_absolute() else path.resolve()
+
+
+_known_existing: set[Path] = set()
 
 
 def ensure_dir(path: Path) -> None:
+    # Remembers directories created or seen this run; remove_dir_if_exists forgets them all.
+    if path in _known_existing:
+        return
     path.mkdir(parents=True, exist_ok=True)
+    _known_existing.add(path)
+
+
+_HYPHEN_RUN = re.compile(r"-+")
+
+
+def _ensure_registry_ready() -> None:
+    """Create the registry skills dir; ensure_dir remembers it, so repeat calls skip the mkdir."""
+    ensure_dir(registry_skills_dir())
 
 
 def normalize_skill_name(name: str) -> str:
     normalized = "-".join(name.strip().lower().replace("_", "-").split())
-    while "--" in normalized:
-        normalized = normalized.replace("--", "-")
-    return normalized.strip("-")
+    return _HYPHEN_RUN.sub("-", normalized).strip("-")
 
 
-SKILL_MD_NAMES = {"SKILL.md", "SKILLS.md", "skills.md"}
+# Ordered so the common `SKILL.md` case short-circuits first.
+SKILL_MD_NAMES = ("SKILL.md", "SKILLS.md", "skills.md")
 
 
-def has_skill_file(path: Path) -> bool:
+def has_skill_file(path: str | os.PathLike[str]) -> bool:
     """Return True if the directory contains any recognized skill manifest file."""
-    return any((path / name).exists() for name in SKILL_MD_NAMES)
+    path = os.fspath(path)
+    return any(os.path.exists(os.path.join(path, name)) for name in SKILL_MD_NAMES)
 
 
 def find_skill_folders_in_dir(path: Path) -> list[Path]:
     """Return sorted direct child directories of `path` that contain a skill manifest file."""
     if not path.is_dir():
         return []
-    return sorted(
-        child for child in path.iterdir()
-        if child.is_dir() and has_skill_file(child)
-    )
+    with os.scandir(path) as entries:
+        # Dot-entries (e.g. `.skills-staging/`) are never skills.
+        hits = [
+            entry.path for entry in entries
+            if not entry.name.startswith(".") and entry.is_dir() and has_skill_file(entry.path)
+        ]
+    # Sort on plain strings and only wrap the survivors in Path.
+    hits.sort()
+    return [Path(hit) for hit in hits]
 
 
 def validate_skill_dir(skill_dir: Path) -> None:
     if not skill_dir.exists() or not skill_dir.is_dir():
-        raise typer.BadParameter(f"Skill source is not a directory: {skill_dir}")
+        raise _bad_parameter(f"Skill source is not a directory: {skill_dir}")
     if not (skill_dir / "SKILL.md").exists():
-        raise typer.BadParameter(f"Missing SKILL.md in: {skill_dir}")
+        raise _bad_parameter(f"Missing SKILL.md in: {skill_dir}")
 
 
 def resolve_skill_source(source: str) -> Path:
     """Accept either a filesystem path or a registered skill name."""
     expanded = expand_home(source)
     if expanded is not None and expanded.exists():
-        return expanded
+        return _absolute(expanded)
 
-    ensure_dir(REGISTRY_SKILLS_DIR)
-    registry_candidate = (REGISTRY_SKILLS_DIR / source).resolve()
+    _ensure_registry_ready()
+    registry_candidate = (registry_skills_dir() / source).resolve()
     if registry_candidate.exists():
         return registry_candidate
 
-    return (expanded if expanded is not None else registry_candidate)
+    return (_absolute(expanded) if expanded is not None else registry_candidate)
+
+
+@functools.lru_cache(maxsize=1)
+def _registered_skill_names() -> tuple[str, ...]:
+    _ensure_registry_ready()
+    # DirEntry.is_dir() reuses the d_type from readdir (symlinks still stat so that linked
+    # skill folders keep being listed), leaving a single isfile() probe per entry.
+    with os.scandir(registry_skills_dir()) as entries:
+        names = [
+            entry.name for entry in entries
+            if not entry.name.startswith(".")
+            and entry.is_dir()
+            and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+        ]
+    names.sort()
+    return tuple(names)
 
 
 def list_registered_skill_names() -> list[str]:
-    ensure_dir(REGISTRY_SKILLS_DIR)
-    names: list[str] = []
-    for item in REGISTRY_SKILLS_DIR.iterdir():
-        if item.is_dir() and (item / "SKILL.md").exists():
-            names.append(item.name)
-    return sorted(names)
+    # The scan is cached per process; copy_dir/remove_dir_if_exists clear it on registry writes.
+    return list(_registered_skill_names())
+
+
+def write_file_bytes(path: Path, data: bytes) -> None:
+    """Create or truncate `path` and write `data` through a raw descriptor (no io buffering)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def read_text_if_exists(path: Path) -> str | None:
+    """Read a small UTF-8 file in one go, with newlines normalized like text mode would."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size or 1 << 16)]
+        # Keep reading until EOF in case the file grew or the first read came back short.
+        while chunks[-1]:
+            chunks.append(os.read(fd, 1 << 16))
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+_DEFAULT_BUILDER_PROMPT = (
+    "ROLE\n"
+    "You are a Senior Agentic Skill Architect specializing in Progressive Disclosure skill bundles.\n\n"
+    "OBJECTIVE\n"
+    "Convert the provided @ref folder into a compliant skill bundle.\n\n"
+    "CRITICAL\n"
+    "If no valid @ref folder is provided, stop and ask for it.\n\n"
+    "MANDATORY\n"
+    "- Enforce 1-3-10 rule\n"
+    "- Keep SKILL.md focused on critical setup/invariants only\n"
+    "- Put deep details in /references\n"
+    "- Split references semantically (not arbitrary line splits)\n"
+    "- Keep each reference file under 800 lines\n"
+    "- Pin supported versions in SKILL.md metadata\n"
+    "- Include activation semantics with triggers and priority\n\n"
+    "CLI HANDOFF\n"
+    "Do NOT copy skills to agent directories.\n"
+    "Place the generated skill bundle only in the local registry path requested by the user/runner.\n"
+    "Agent distribution is handled by the Python CLI (~/skills/cli.py) using install/sync commands.\n"
+)
+
+_DEFAULT_IMPROVE_PROMPT = (
+    "ROLE\n"
+    "You are a Senior Agentic Skill Refiner. Improve an existing registered skill folder so it reaches STRICT quality while preserving correctness and usefulness.\n\n"
+    "ENTRY FORMAT (MANDATORY)\n"
+    "This prompt is invoked like: `~/skills/skill.improve <skill_name_or_path>`\n"
+    "Parse the invocation on the first line and extract `<skill_name_or_path>`.\n"
+    "If no target is provided, stop and ask for one.\n\n"
+    "DISCOVERY (MANDATORY)\n"
+    "1. If the argument looks like a path and exists, use that folder as the target skill folder.\n"
+    "2. Otherwise, treat it as a registered skill name and resolve the target folder from the local registry.\n"
+    "3. If no target folder exists, stop and ask the user to create/register the skill first.\n"
+    "4. Run: `skills verify <skill_name_or_path> --strict --verbose`\n"
+    "5. Use STRICT findings as the improvement checklist.\n\n"
+    "GOAL\n"
+    "Improve the entire target skill folder (all relevant files, not just SKILL.md) so it passes STRICT mode.\n"
+    "Minor refinement additions are allowed if they improve clarity, consistency, and agentskills.io alignment.\n"
+    "If the target is an unregistered local folder in bad shape, repair it enough to pass verification, then the user can register it.\n\n"
+    "COMMON FIXES FOR STRICT PASS\n"
+    "- Add/repair frontmatter fields used by strict quality checks (`triggers`, `references`, `activation`)\n"
+    "- Move examples/large code blocks out of `SKILL.md` into `references/`\n"
+    "- Reorganize references under taxonomy folders (`references/<category>/...`)\n"
+    "- Ensure `references` paths exist and are relative\n"
+    "- Add version governance / compatibility metadata\n"
+    "- Keep SKILL.md as 'brain only' (critical setup rules and invariants)\n\n"
+    "WORKFLOW\n"
+    "1. Verify in STRICT mode.\n"
+    "2. Load and edit files in the registered skill folder in-place.\n"
+    "3. Re-run STRICT verify.\n"
+    "4. Repeat until STRICT passes or clarification is needed.\n\n"
+    "CONSTRAINTS\n"
+    "- Do not copy to agent directories directly (`skills install` handles distribution).\n"
+    "- Preserve agentskills.io spec compliance while improving strict quality.\n"
+    "- If the folder is missing `SKILL.md` or has invalid YAML, create/fix it as part of the improvement.\n"
+)
+
+
+def _legacy_builder_prompt() -> str | None:
+    legacy_path = home_dir() / "skill.build"
     try:
-        return path.read_text(encoding="utf-8")
+        mtime_ns = legacy_path.stat().st_mtime_ns
     except FileNotFoundError:
         return None
+    return _render_legacy_builder_prompt(legacy_path, mtime_ns)
 
 
-def default_builder_prompt() -> str:
-    legacy_path = HOME / "skill.build"
-    legacy = read_text_if_exists(legacy_path)
-    if legacy:
-        text = legacy.replace("\r\n", "\n")
+@functools.lru_cache(maxsize=1)
+def _render_legacy_builder_prompt(legacy_path: Path, mtime_ns: int) -> str | None:
+    # Keyed on mtime so an edited skill.build is picked up while unchanged ones skip the read.
+    text = read_text_if_exists(legacy_path)
+    if text:
         marker = "You must create a copy of the generated skill at each location:"
         if marker in text:
-            text = text.split(marker, 1)[0].rstrip()
+            text = text.partition(marker)[0].rstrip()
         if "CLI HANDOFF" not in text:
             text += (
                 "\n\nCLI HANDOFF\n"
@@ -125,748 +318,524 @@ def default_builder_prompt() -> str:
                 "Agent distribution is handled by the Python CLI (~/skills/cli.py) using install/sync commands.\n"
             )
         return text.rstrip() + "\n"
+    return None
 
-    return (
-        "ROLE\n"
-        "You are a Senior Agentic Skill Architect specializing in Progressive Disclosure skill bundles.\n\n"
-        "OBJECTIVE\n"
-        "Convert the provided @ref folder into a compliant skill bundle.\n\n"
-        "CRITICAL\n"
-        "If no valid @ref folder is provided, stop and ask for it.\n\n"
-        "MANDATORY\n"
-        "- Enforce 1-3-10 rule\n"
-        "- Keep SKILL.md focused on critical setup/invariants only\n"
-        "- Put deep details in /references\n"
-        "- Split references semantically (not arbitrary line splits)\n"
-        "- Keep each reference file under 800 lines\n"
-        "- Pin supported versions in SKILL.md metadata\n"
-        "- Include activation semantics with triggers and priority\n\n"
-        "CLI HANDOFF\n"
-        "Do NOT copy skills to agent directories.\n"
-        "Place the generated skill bundle only in the local registry path requested by the user/runner.\n"
-        "Agent distribution is handled by the Python CLI (~/skills/cli.py) using install/sync commands.\n"
-    )
+
+def default_builder_prompt() -> str:
+    return _legacy_builder_prompt() or _DEFAULT_BUILDER_PROMPT
 
 
 def default_improve_prompt() -> str:
-    return (
-        "ROLE\n"
-        "You are a Senior Agentic Skill Refiner. Improve an existing registered skill folder so it reaches STRICT quality while preserving correctness and usefulness.\n\n"
-        "ENTRY FORMAT (MANDATORY)\n"
-        "This prompt is invoked like: `~/skills/skill.improve <skill_name_or_path>`\n"
-        "Parse the invocation on the first line and extract `<skill_name_or_path>`.\n"
-        "If no target is provided, stop and ask for one.\n\n"
-        "DISCOVERY (MANDATORY)\n"
-        "1. If the argument looks like a path and exists, use that folder as the target skill folder.\n"
-        "2. Otherwise, treat it as a registered skill name and resolve the target folder from the local registry.\n"
-        "3. If no target folder exists, stop and ask the user to create/register the skill first.\n"
-        "4. Run: `skills verify <skill_name_or_path> --strict --verbose`\n"
-        "5. Use STRICT findings as the improvement checklist.\n\n"
-        "GOAL\n"
-        "Improve the entire target skill folder (all relevant files, not just SKILL.md) so it passes STRICT mode.\n"
-        "Minor refinement additions are allowed if they improve clarity, consistency, and agentskills.io alignment.\n"
-        "If the target is an unregistered local folder in bad shape, repair it enough to pass verification, then the user can register it.\n\n"
-        "COMMON FIXES FOR STRICT PASS\n"
-        "- Add/repair frontmatter fields used by strict quality checks (`triggers`, `references`, `activation`)\n"
-        "- Move examples/large code blocks out of `SKILL.md` into `references/`\n"
-        "- Reorganize references under taxonomy folders (`references/<category>/...`)\n"
-        "- Ensure `references` paths exist and are relative\n"
-        "- Add version governance / compatibility metadata\n"
-        "- Keep SKILL.md as 'brain only' (critical setup rules and invariants)\n\n"
-        "WORKFLOW\n"
-        "1. Verify in STRICT mode.\n"
-        "2. Load and edit files in the registered skill folder in-place.\n"
-        "3. Re-run STRICT verify.\n"
-        "4. Repeat until STRICT passes or clarification is needed.\n\n"
-        "CONSTRAINTS\n"
-        "- Do not copy to agent directories directly (`skills install` handles distribution).\n"
-        "- Preserve agentskills.io spec compliance while improving strict quality.\n"
-        "- If the folder is missing `SKILL.md` or has invalid YAML, create/fix it as part of the improvement.\n"
-    )
+    return _DEFAULT_IMPROVE_PROMPT
 
 
 def project_root_from_option(project: str | None) -> Path:
     if project:
-        return expand_home(project) or Path.cwd()
+        return _absolute(expand_home(project))
     return Path.cwd().resolve()
 
 
-def agent_targets(project_root: Path) -> dict[str, Path]:
-    return {
-        "codex": HOME / ".codex" / "skills",
+@functools.lru_cache(maxsize=16)
+def agent_targets(project_root: Path) -> Mapping[str, Path]:
+    # Cached per project root; the read-only view keeps callers from mutating the shared dict.
+    return MappingProxyType({
+        "codex": home_dir() / ".codex" / "skills",
         "claude": project_root / ".claude" / "skills",
         "kiro": project_root / ".kiro" / "skills",
         "gemini": project_root / ".gemini" / "skills",
         "antigravity": project_root / ".agent" / "skills",
-    }
+    })
 
 
-def parse_agents(agent: list[str] | None) -> list[str]:
-    if not agent:
-        return list(AGENTS)
-    parsed: list[str] = []
-    for value in agent:
-        for token in value.split(","):
-            name = token.strip().lower()
-            if not name:
-                continue
-            if name == "all":
-                return list(AGENTS)
-            if name not in AGENTS:
-                raise typer.BadParameter(f"Unknown agent: {name}")
-            if name not in parsed:
-                parsed.append(name)
-    return parsed or list(AGENTS)
-
-
-def copy_dir(src: Path, dest: Path) -> None:
-    if dest.exists():
-        shutil.rmtree(dest)
-    shutil.copytree(src, dest)
-
-
-def remove_dir_if_exists(target: Path) -> bool:
-    if not target.exists():
-        return False
-    if target.is_dir():
-        shutil.rmtree(target)
-    else:
-        target.unlink()
-    return True
-
-
-def require_force(force: bool, action: str) -> None:
-    if not force:
-        raise typer.BadParameter(f"{action} is destructive. Re-run with --force.")
-
-
-def install_skills(
-    skill_names: list[str],
-    agents: list[str],
-    project_root: Path,
-    *,
-    mode: str = "install",
-) -> None:
-    if not skill_names:
-        raise typer.BadParameter("No skills specified for install")
-    targets = agent_targets(project_root)
-    ensure_dir(REGISTRY_SKILLS_DIR)
-
-    for skill_name in skill_names:
-        src = REGISTRY_SKILLS_DIR / skill_name
-        validate_skill_dir(src)
-        for agent in agents:
-            dest_root = targets[agent]
-            ensure_dir(dest_root)
-            dest = dest_root / skill_name
-            copy_dir(src, dest)
-            if mode == "sync":
-                typer.echo(f"[sync] updated {skill_name} -> {dest}")
-            else:
-                typer.echo(f"[install] {skill_name} -> {agent} ({dest})")
-
-
-def desync_skills(skill_names: list[str], agents: list[str], project_root: Path) -> None:
-    if not skill_names:
-        raise typer.BadParameter("No skills specified for desync")
+def _where_lines(project_root: Path) -> list[str]:
     targets = agent_targets(project_root)
-    for skill_name in skill_names:
-        for agent in agents:
-            dest = targets[agent] / skill_name
-            if remove_dir_if_exists(dest):
-                typer.echo(f"[desync] removed {skill_name} from {agent} ({dest})")
-            else:
-                typer.echo(f"[desync] missing {skill_name} in {agent} ({dest})")
+    lines = [
+        f"registryRoot: {registry_root()}",
+        f"registrySkills: {registry_skills_dir()}",
+        f"builderPrompt: {builder_prompt_path()}",
+        f"improvePrompt: {improve_prompt_path()}",
+        f"projectRoot: {project_root}",
+    ]
+    lines.extend(f"{agent_name}: {targets[agent_name]}" for agent_name in AGENTS)
+    return lines
 
 
-def main() -> None:
-    app()
+def parse_agents(agent: list[str] | None) -> list[str]:
+    if not agent:
+        return list(AGENTS)
+    # One C-level pass drops whitespace from every token; dict keys dedupe in first-seen order.
+    parsed: dict[str, None] = {}
+    for name in ",".join(agent).translate(_WHITESPACE_DROP).lower().split(","):
+        if not name:
+            continue
+        if name == "all":
+            return list(AGENTS)
+        if name not in _AGENTS_SET:
+            raise _bad_parameter(f"Unknown agent: {name}")
+        parsed[name] = None
+    return list(parsed) or list(AGENTS)
 
 
-def _enforce_gate(result, gate: str) -> None:
-    gate = gate.lower().strip()
-    if gate not in {"spec", "strict"}:
-        raise typer.BadParameter("`--gate` must be `spec` or `strict`.")
-    if gate == "spec" and not result.spec_passed:
-        raise typer.Exit(code=1)
-    if gate == "strict" and not result.strict_passed:
-        raise typer.Exit(code=1)
+def _link_or_copy(src: str, dst: str) -> str:
+    # Hard links fail across filesystems (EXDEV) or where unsupported; fall back to a real copy.
+    try:
+        os.link(src, dst)
+    except OSError:
+        import shutil
 
+        return shutil.copy2(src, dst)
+    return dst
 
-def _gate_passed(result, gate: str) -> bool:
-    gate = gate.lower().strip()
-    if gate not in {"spec", "strict"}:
-        raise typer.BadParameter("`--gate` must be `spec` or `strict`.")
-    return result.spec_passed if gate == "spec" else result.strict_passed
 
+def _remove_entry(entry: os.DirEntry) -> None:
+    if entry.is_dir(follow_symlinks=False):
+        import shutil
 
-def _status_text(passed: bool) -> str:
-    return "PASS" if passed else "FAIL"
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)
+
+
+def _same_bytes(a: str, b: str) -> bool:
+    # Callers have already matched the sizes. Not filecmp.cmp: its cache is keyed on size and
+    # mtime, exactly the signature that cannot be trusted here.
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            chunk = fa.read(1 << 16)
+            if chunk != fb.read(1 << 16):
+                return False
+            if not chunk:
+                return True
+
+
+def _sync_tree(src: str, dest: str, copy_function, staging_root: str) -> None:
+    """Bring the existing directory `dest` in line with `src`, touching only what changed."""
+    import shutil
+    import threading
+
+    with os.scandir(dest) as entries:
+        stale = {entry.name: entry for entry in entries}
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dest, entry.name)
+            current = stale.pop(entry.name, None)
+            if entry.is_dir():
+                if current is not None and current.is_dir(follow_symlinks=False):
+                    _sync_tree(entry.path, target, copy_function, staging_root)
+                    continue
+                if current is not None:
+                    _remove_entry(current)
+                shutil.copytree(entry.path, target, copy_function=copy_function)
+                continue
+            if current is not None and current.is_file(follow_symlinks=False):
+                have, want = current.stat(follow_symlinks=False), entry.stat()
+                # copy2 and hard links both carry the source mtime over, but sources with
+                # normalized timestamps (archive extracts, reproducible builds) can change content
+                # at the same size and mtime, so matching stats only skip the copy once the bytes
+                # agree too. A copy-mode sync still replaces files hard-linked by `--link`.
+                if have.st_size == want.st_size and have.st_mtime_ns == want.st_mtime_ns:
+                    if os.path.samestat(have, want):
+                        if copy_function is _link_or_copy:
+                            continue
+                    elif _same_bytes(current.path, entry.path):
+                        continue
+            if current is not None and current.is_dir(follow_symlinks=False):
+                _remove_entry(current)
+            # Never write into `target` in place: it may be a hard link that shares storage with
+            # the previous source. Copy into the staging dir and swap it in.
+            os.makedirs(staging_root, exist_ok=True)
+            staging = os.path.join(staging_root, f"{threading.get_ident()}.file.tmp-{os.getpid()}")
+            copy_function(entry.path, staging)
+            os.replace(staging, target)
+    for entry in stale.values():
+        _remove_entry(entry)
+
+
+# Hidden per-directory scratch space for staged copies and trees on their way out. Listings skip
+# dot-entries, so a tree stranded here by a crash (SKILL.md and all) is never taken for a skill.
+_STAGING_DIR_NAME = ".skills-staging"
+# Where a pid cannot be probed, staging entries untouched for this long count as abandoned.
+_STALE_STAGING_SECONDS = 3600
+
+
+def _staging_root(dest: Path) -> Path:
+    return dest.parent / _STAGING_DIR_NAME
+
+
+def _pid_alive(pid: int) -> bool | None:
+    """Whether `pid` is running; None where that cannot be checked safely."""
+    if os.name != "posix":
+        # os.kill(pid, 0) would terminate the process on Windows.
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
 
 
-def _status_color(passed: bool) -> str:
-    return "green" if passed else "red"
+def _sweep_stale_staging(root: Path, name: str) -> None:
+    """Remove staging entries left by runs that died mid-copy.
 
+    Entries end in `-<pid>`. Other processes' entries go once that pid is gone (or, where pids
+    cannot be probed, once they have sat untouched for an hour); this process's own entries
+    only for `name`, since sibling threads may be staging other skills right now.
+    """
+    import time
 
-def _render_issue_group(title: str, errors, warnings) -> None:
-    if not errors and not warnings:
-        return
-    typer.secho(f"\n{title}", fg=typer.colors.BRIGHT_BLUE, bold=True)
-    for issue in errors:
-        typer.secho(f"  [ERROR] {issue.message}", fg=typer.colors.RED)
-    for issue in warnings:
-        typer.secho(f"  [WARN]  {issue.message}", fg=typer.colors.YELLOW)
-
-
-def _verification_payload(result, verbose: bool = False) -> dict:
-    payload = {
-        "skill_dir": str(result.skill_dir),
-        "grades": {
-            "spec": {"score": result.spec_grade, "status": _status_text(result.spec_passed)},
-            "strict": {
-                "score": result.strict_grade,
-                "status": _status_text(result.strict_passed),
-                "threshold": result.strict_threshold,
-            },
-        },
-        "counts": {
-            "spec": {"errors": len(result.spec_errors), "warnings": len(result.spec_warnings)},
-            "strict": {"errors": len(result.errors), "warnings": len(result.warnings)},
-        },
-    }
-    if verbose:
-        payload["findings"] = {
-            "spec": {
-                "errors": [i.message for i in result.spec_errors],
-                "warnings": [i.message for i in result.spec_warnings],
-            },
-            "strict": {
-                "errors": [i.message for i in result.errors],
-                "warnings": [i.message for i in result.warnings],
-            },
-        }
-    return payload
-
-
-def _print_verification_report_text(result, verbose: bool = False) -> None:
-    p = _verification_payload(result, verbose=verbose)
-    typer.echo(f"[verify] {p['skill_dir']}")
-    typer.echo(
-        f"[verify] SPEC   grade={p['grades']['spec']['score']}/100 status={p['grades']['spec']['status']} "
-        f"errors={p['counts']['spec']['errors']} warnings={p['counts']['spec']['warnings']}"
-    )
-    typer.echo(
-        f"[verify] STRICT grade={p['grades']['strict']['score']}/100 status={p['grades']['strict']['status']} "
-        f"threshold={p['grades']['strict']['threshold']} "
-        f"errors={p['counts']['strict']['errors']} warnings={p['counts']['strict']['warnings']}"
-    )
-    if not verbose:
-        if any([p["counts"]["spec"]["errors"], p["counts"]["spec"]["warnings"], p["counts"]["strict"]["errors"], p["counts"]["strict"]["warnings"]]):
-            typer.echo("[verify] Use --verbose for full findings.")
-        return
-    findings = p.get("findings", {})
-    for scope in ("spec", "strict"):
-        f = findings.get(scope, {})
-        if not f.get("errors") and not f.get("warnings"):
-            continue
-        typer.echo(f"[verify] {scope.upper()} Findings")
-        for msg in f.get("errors", []):
-            typer.echo(f"  {scope.upper()} ERROR: {msg}")
-        for msg in f.get("warnings", []):
-            typer.echo(f"  {scope.upper()} WARN: {msg}")
-
-
-def _print_verification_report(result, verbose: bool = False, output: str = "pretty") -> None:
-    output = output.lower().strip()
-    if output not in {"pretty", "text", "json"}:
-        raise typer.BadParameter("`--output` must be `pretty`, `text`, or `json`.")
-    if output == "json":
-        typer.echo(json.dumps(_verification_payload(result, verbose=verbose), indent=2))
-        return
-    if output == "text":
-        _print_verification_report_text(result, verbose=verbose)
+    try:
+        entries = os.scandir(root)
+    except FileNotFoundError:
         return
+    own_pid = os.getpid()
+    with entries:
+        for entry in entries:
+            base, _, pid = entry.name.rpartition("-")
+            if not pid.isdigit():
+                continue
+            if int(pid) == own_pid:
+                stale = base in (f"{name}.tmp", f"{name}.old")
+            else:
+                alive = _pid_alive(int(pid))
+                if alive is None:
+                    age = time.time() - entry.stat(follow_symlinks=False).st_mtime
+                    stale = age > _STALE_STAGING_SECONDS
+                else:
+                    stale = not alive
+            if stale:
+                try:
+                    _remove_entry(entry)
+                except FileNotFoundError:  # another run swept it first
+                    pass
+
+
+def _drop_staging_root(root: Path) -> None:
+    # Only succeeds once empty, so a concurrent run's entries keep the directory alive.
+    try:
+        os.rmdir(root)
+    except OSError:
+        pass
 
-    typer.secho(f"\nVerify: {result.skill_dir}", fg=typer.colors.CYAN, bold=True)
-    typer.echo("-" * 72)
 
-    typer.echo("Grades")
-    typer.secho(
-        f"  SPEC   : {_status_text(result.spec_passed)}  ({result.spec_grade}/100)",
-        fg=_status_color(result.spec_passed),
-        bold=result.spec_passed,
-    )
-    strict_text = (
-        f"  STRICT : {_status_text(result.strict_passed)}  "
-        f"({result.strict_grade}/100, threshold={result.strict_threshold})"
-    )
-    typer.secho(
-        strict_text,
-        fg=_status_color(result.strict_passed),
-        bold=result.strict_passed,
-    )
-    typer.echo(
-        f"Counts  SPEC(e={len(result.spec_errors)}, w={len(result.spec_warnings)})  "
-        f"STRICT(e={len(result.errors)}, w={len(result.warnings)})"
-    )
+def copy_dir(src: Path, dest: Path, *, link: bool = False) -> None:
+    """Replace `dest` with a copy of `src`.
 
-    if not result.spec_issues and not result.issues:
-        typer.secho("\nNo findings.", fg=typer.colors.GREEN)
-        return
+    When `dest` is already a directory it is updated in place: only files whose size, mtime
+    or content differ from `src` are recopied (each one swapped in with an atomic rename), and
+    entries missing from `src` are removed. Otherwise the copy is staged under the hidden
+    `.skills-staging/` sibling and renamed into place, so a fresh `dest` is never left
+    half-populated if the CLI dies mid-copy.
 
-    if not verbose:
-        if result.spec_errors or result.errors:
-            seen = set()
-            merged_errors = []
-            for issue in [*result.spec_errors, *result.errors]:
-                key = issue.message
-                if key in seen:
-                    continue
-                seen.add(key)
-                merged_errors.append(issue)
-            _render_issue_group("Errors", merged_errors, [])
-        typer.secho(
-            "\nTip: Use --verbose for full spec/strict warnings and grouped findings.",
-            fg=typer.colors.BRIGHT_BLACK,
-        )
+    With `link=True` files are hard-linked when possible, so no file data is copied. The
+    copy then shares storage with `src`: editing either side in place changes both, so this
+    is only used when the user opts in (`install --link` / `sync --link`).
+    """
+    import shutil
+
+    copy_function = _link_or_copy if link else shutil.copy2
+    root = _staging_root(dest)
+    if os.path.isdir(dest) and not os.path.islink(dest):
+        _sync_tree(os.fspath(src), os.fspath(dest), copy_function, os.fspath(root))
+        _drop_staging_root(root)
+        _registered_skill_names.cache_clear()
         return
 
-    _render_issue_group("Spec Findings", result.spec_errors, result.spec_warnings)
-    _render_issue_group("Strict Findings", result.errors, result.warnings)
-
-
-@app.command()
-def init(
-    force_prompt: Annotated[bool, typer.Option("--force-prompt", help="Rewrite ~/skills/skill.build")]
-    = False,
-    force_improve_prompt: Annotated[
-        bool, typer.Option("--force-improve-prompt", help="Rewrite ~/skills/skill.improve")
-    ] = False,
-) -> None:
-    """Create ~/skills layout and seed skill.build."""
-    ensure_dir(REGISTRY_ROOT)
-    ensure_dir(REGISTRY_SKILLS_DIR)
-
-    if force_prompt or not BUILDER_PROMPT_PATH.exists():
-        BUILDER_PROMPT_PATH.write_text(default_builder_prompt(), encoding="utf-8")
-        typer.echo(f"Wrote prompt: {BUILDER_PROMPT_PATH}")
-    else:
-        typer.echo(f"Prompt exists: {BUILDER_PROMPT_PATH}")
-
-    if force_improve_prompt or not IMPROVE_PROMPT_PATH.exists():
-        IMPROVE_PROMPT_PATH.write_text(default_improve_prompt(), encoding="utf-8")
-        typer.echo(f"Wrote improve prompt: {IMPROVE_PROMPT_PATH}")
+    # Per-process names, so concurrent runs never clear each other's staging trees.
+    staging = root / f"{dest.name}.tmp-{os.getpid()}"
+    old = root / f"{dest.name}.old-{os.getpid()}"
+    _sweep_stale_staging(root, dest.name)
+    shutil.copytree(src, staging, copy_function=copy_function)
+    if dest.exists() or dest.is_symlink():
+        os.replace(dest, old)
+        os.replace(staging, dest)
+        # Already out of the way, so the teardown no longer sits between the two renames.
+        if os.path.islink(old):
+            os.unlink(old)
+        else:
+            shutil.rmtree(old)
     else:
-        typer.echo(f"Improve prompt exists: {IMPROVE_PROMPT_PATH}")
+        os.replace(staging, dest)
+    _drop_staging_root(root)
+    _registered_skill_names.cache_clear()
 
-    typer.echo(f"Registry skills dir: {REGISTRY_SKILLS_DIR}")
 
+def remove_dir_if_exists(target: Path) -> bool:
+    if not target.exists():
+        return False
+    if target.is_dir() and not target.is_symlink():
+        import shutil
+
+        # Move the tree aside first so readers see it vanish in one rename, not file by file.
+        root = _staging_root(target)
+        doomed = root / f"{target.name}.old-{os.getpid()}"
+        _sweep_stale_staging(root, target.name)
+        try:
+            os.makedirs(root, exist_ok=True)
+            os.replace(target, doomed)
+            target = doomed
+        except OSError:
+            pass
+        shutil.rmtree(target)
+        _drop_staging_root(root)
+    else:
+        target.unlink()
+    _known_existing.clear()
+    _registered_skill_names.cache_clear()
+    return True
 
-@app.command("list")
-def list_cmd() -> None:
-    """List registered skills."""
-    skills = list_registered_skill_names()
-    if not skills:
-        typer.echo("No registered skills found.")
-        return
-    for skill in skills:
-        typer.echo(skill)
 
+def require_force(force: bool, action: str) -> None:
+    if not force:
+        raise _bad_parameter(f"{action} is destructive. Re-run with --force.")
 
-@app.command()
-def create(
-    name: Annotated[str, typer.Argument(help="Skill name (used as folder name)")],
-    force: Annotated[bool, typer.Option("--force", help="Overwrite existing registry skill folder")] = False,
-) -> None:
-    """Create a minimal skill scaffold in ~/skills/skills/<name>."""
-    ensure_dir(REGISTRY_SKILLS_DIR)
-
-    skill_name = normalize_skill_name(name)
-    if not skill_name:
-        raise typer.BadParameter("Skill name is empty after normalization")
-
-    skill_dir = REGISTRY_SKILLS_DIR / skill_name
-    references_dir = skill_dir / "references"
-    misc_references_dir = references_dir / "misc"
-    skill_md = skill_dir / "SKILL.md"
-
-    if skill_dir.exists():
-        if not force:
-            raise typer.BadParameter(
-                f"Skill already exists: {skill_dir}. Use --force to overwrite."
-            )
-        shutil.rmtree(skill_dir)
-
-    ensure_dir(misc_references_dir)
-    skill_md.write_text(
-        (
-            "---\n"
-            f"name: {skill_name}\n"
-            "description: >-\n"
-            f"  Describe what the `{skill_name}` skill does and when to use it.\n"
-            "triggers:\n"
-            f"  - {skill_name}\n"
-            "references:\n"
-            "  - references/misc/overview.md\n"
-            "compatibility: \"Add supported versions/platforms here\"\n"
-            "metadata:\n"
-            "  skill_version: \"0.1.0\"\n"
-            "  owner: \"\"\n"
-            "activation:\n"
-            "  mode: fuzzy\n"
-            "  triggers:\n"
-            f"    - {skill_name}\n"
-            "  priority: normal\n"
-            "---\n\n"
-            "# Skill Instructions\n\n"
-            "Keep this file focused on critical setup rules and invariants only.\n\n"
-            "## Critical Rules\n\n"
-            "1. Replace this scaffold with the actual setup constraints.\n"
-            "2. Move detailed docs/examples into `references/` files.\n"
-        ),
-        encoding="utf-8",
-    )
-    (misc_references_dir / "overview.md").write_text(
-        (
-            f"# {skill_name} Reference\n\n"
-            "Add detailed documentation, examples, API notes, and patterns here.\n"
-        ),
-        encoding="utf-8",
-    )
 
-    typer.echo(f"[create] scaffolded {skill_dir}")
-    typer.echo(f"[create] edit {skill_md}")
+def _write_lines(lines: list[str]) -> None:
+    # One buffered write instead of a click echo (and flush) per line.
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
-@app.command()
-def register(
-    sources: Annotated[
-        list[str],
-        typer.Argument(
-            help=(
-                "Path(s) to skill folder(s). "
-                "Pass '.' to discover all skill subfolders in the current directory. "
-                "Multiple paths are accepted: skills register path1 path2 path3"
-            )
-        ),
-    ] = [],
-    name: Annotated[
-        Optional[str],
-        typer.Option("--name", help="Override registry folder name (single skill only)"),
-    ] = None,
-    install: Annotated[bool, typer.Option("--install", help="Install to agent directories after register")] = False,
-    agent: Annotated[list[str], typer.Option("--agent", help="Agent(s): codex,claude,kiro,gemini,antigravity,all")] = [],
-    project: Annotated[Optional[str], typer.Option("--project", help="Project root for agent-local folders")] = None,
-    gate: Annotated[str, typer.Option("--gate", help="Registration gate: spec or strict")] = "spec",
-    verbose: Annotated[bool, typer.Option("--verbose", help="Show full verification findings")] = False,
-    output: Annotated[str, typer.Option("--output", help="Verification output format: pretty, text, json")] = "pretty",
-) -> None:
-    """Register one or more skills into ~/skills/skills.
+def _run_parallel(fn, tasks: list[tuple], *, max_workers: int = 32, return_exceptions: bool = False) -> list:
+    """Run `fn(*task)` for every task on a thread pool; results keep task order.
 
-    Pass '.' to discover and register all skill subfolders in the current directory.
-    Multiple explicit paths are also accepted.
+    With `return_exceptions=True` a failing task yields its exception in place of a result,
+    so callers can still report the tasks that did finish.
     """
-    raw_sources = list(sources)
-    if not raw_sources:
-        raw_sources = [typer.prompt("Skill source folder path")]
-
-    if name and len(raw_sources) > 1:
-        raise typer.BadParameter("--name cannot be used when registering multiple skills.")
-
-    # Expand each source: directories without a skill file trigger discovery of subfolders
-    resolved: list[Path] = []
-    for src in raw_sources:
-        p = expand_home(src)
-        if p is None:
-            raise typer.BadParameter(f"Invalid path: {src}")
-        if p.is_dir() and not has_skill_file(p):
-            discovered = find_skill_folders_in_dir(p)
-            if not discovered:
-                typer.secho(f"[register] No skill folders found in: {p}", fg=typer.colors.YELLOW)
-            else:
-                typer.echo(f"[register] Discovered {len(discovered)} skill folder(s) in: {p}")
-                resolved.extend(discovered)
-        else:
-            resolved.append(p)
-
-    if not resolved:
-        raise typer.BadParameter("No skill source paths resolved.")
-
-    batch = len(resolved) > 1
-    project_root = project_root_from_option(project)
-    agents = parse_agents(agent)
-    success_count = 0
-    fail_count = 0
-
-    for src_path in resolved:
-        if batch:
-            typer.secho(f"\n--- {src_path.name} ---", fg=typer.colors.CYAN)
-
-        verification = verify_skill_directory(src_path)
-        _print_verification_report(verification, verbose=verbose, output=output)
-
-        if not _gate_passed(verification, gate):
-            if batch:
-                typer.secho(
-                    f"[register] Skipped {src_path.name} (failed `{gate}` gate).",
-                    fg=typer.colors.YELLOW,
-                )
-                fail_count += 1
-                continue
-            typer.secho(
-                f"\nRegistration blocked by `{gate}` gate.",
-                fg=typer.colors.RED,
-                bold=True,
-            )
-            typer.secho(
-                f"Repair path: run `skills improve {src_path}` and fix the folder in-place, then register again.",
-                fg=typer.colors.YELLOW,
-            )
-            raise typer.Exit(code=1)
-
-        skill_name = (name or src_path.name).strip()
-        if not skill_name:
-            if batch:
-                typer.secho(
-                    f"[register] Skipped: resolved skill name is empty for {src_path}",
-                    fg=typer.colors.YELLOW,
-                )
-                fail_count += 1
-                continue
-            raise typer.BadParameter("Resolved skill name is empty")
-
-        frontmatter_name = verification.get_frontmatter_name()
-        if frontmatter_name and name and skill_name != frontmatter_name:
-            if batch:
-                typer.secho(
-                    f"[register] Skipped {src_path.name}: --name ({skill_name}) does not match "
-                    f"SKILL.md name ({frontmatter_name}).",
-                    fg=typer.colors.YELLOW,
-                )
-                fail_count += 1
-                continue
-            raise typer.BadParameter(
-                f"--name ({skill_name}) must match SKILL.md frontmatter name ({frontmatter_name}) to remain spec-compliant."
-            )
-
-        ensure_dir(REGISTRY_SKILLS_DIR)
-        dest = REGISTRY_SKILLS_DIR / skill_name
-        copy_dir(src_path, dest)
-        typer.echo(f"[register] {src_path} -> {dest}")
-        success_count += 1
-
-        if install:
-            install_skills([skill_name], agents, project_root)
-
-    if batch:
-        typer.echo(f"\n[register] Done: {success_count} registered, {fail_count} skipped.")
-        if fail_count > 0:
-            raise typer.Exit(code=1)
-
-
-@app.command()
-def verify(
-    source: Annotated[str, typer.Argument(help="Path to a skill folder OR registered skill name")],
-    gate: Annotated[str, typer.Option("--gate", help="Exit-code gate: spec or strict")] = "spec",
-    strict: Annotated[bool, typer.Option("--strict", help="Shortcut for --gate strict")] = False,
-    verbose: Annotated[bool, typer.Option("--verbose", help="Show full verification findings")] = False,
-    output: Annotated[str, typer.Option("--output", help="Output format: pretty, text, json")] = "pretty",
-) -> None:
-    """Validate a skill folder against the Agent Skills spec checks."""
-    src_path = resolve_skill_source(source)
-    if src_path is None:
-        raise typer.BadParameter("Missing source path")
-    if strict:
-        gate = "strict"
-    result = verify_skill_directory(src_path)
-    _print_verification_report(result, verbose=verbose, output=output)
-    _enforce_gate(result, gate)
-
-
-@app.command()
-def deregister(
-    skill_name: Annotated[Optional[str], typer.Argument(help="Registered skill name")] = None,
-    all: Annotated[bool, typer.Option("--all", help="Remove all registered skills from registry")] = False,
-    force: Annotated[bool, typer.Option("--force", help="Confirm destructive removal")] = False,
-) -> None:
-    """Remove skill(s) from the global registry (~/skills/skills)."""
-    require_force(force, "deregister")
-    ensure_dir(REGISTRY_SKILLS_DIR)
-
-    if all:
-        names = list_registered_skill_names()
-        if not names:
-            typer.echo("No registered skills to deregister.")
-            raise typer.Exit(0)
-    elif skill_name:
-        names = [skill_name]
-    else:
-        raise typer.BadParameter("Provide <skill-name> or use --all.")
+    if return_exceptions:
+        fn = functools.partial(_capture_exception, fn)
+    if len(tasks) <= 1:
+        return [fn(*task) for task in tasks]
+    from concurrent.futures import ThreadPoolExecutor
 
-    for name in names:
-        target = REGISTRY_SKILLS_DIR / name
-        if remove_dir_if_exists(target):
-            typer.echo(f"[deregister] removed {target}")
-        else:
-            typer.echo(f"[deregister] missing {target}")
-
-
-@app.command()
-def install(
-    skill_name: Annotated[Optional[str], typer.Argument(help="Registered skill name")]
-    = None,
-    agent: Annotated[list[str], typer.Option("--agent", help="Agent(s): codex,claude,kiro,gemini,antigravity,all")]
-    = [],
-    project: Annotated[Optional[str], typer.Option("--project", help="Project root for agent-local folders")]
-    = None,
-    all: Annotated[bool, typer.Option("--all", help="Install all registered skills")] = False,
-) -> None:
-    """Install registered skill(s) to agent directories."""
-    if all or skill_name is None:
-        skills = list_registered_skill_names()
-        if not skills:
-            typer.echo("No registered skills to install.")
-            raise typer.Exit(0)
-    else:
-        skills = [skill_name]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        return list(executor.map(fn, *zip(*tasks)))
 
-    install_skills(skills, parse_agents(agent), project_root_from_option(project))
 
+def _capture_exception(fn, *args):
+    try:
+        return fn(*args)
+    except Exception as exc:
+        return exc
 
-@app.command()
-def sync(
-    skill_names: Annotated[
-        list[str],
-        typer.Argument(help="Optional registered skill names to sync (defaults to all if omitted)"),
-    ] = [],
-    agent: Annotated[list[str], typer.Option("--agent", help="Agent(s): codex,claude,kiro,gemini,antigravity,all")]
-    = [],
-    project: Annotated[Optional[str], typer.Option("--project", help="Project root for agent-local folders")]
-    = None,
-) -> None:
-    """Sync registered skill(s) to agent directories (all if no skill names are provided)."""
-    skills = skill_names or list_registered_skill_names()
-    if not skills:
-        typer.echo("No registered skills to sync.")
-        raise typer.Exit(0)
-    install_skills(skills, parse_agents(agent), project_root_from_option(project), mode="sync")
-
-
-@app.command()
-def desync(
-    skill_name: Annotated[Optional[str], typer.Argument(help="Installed/registered skill name")] = None,
-    agent: Annotated[list[str], typer.Option("--agent", help="Agent(s): codex,claude,kiro,gemini,antigravity,all")]
-    = [],
-    project: Annotated[Optional[str], typer.Option("--project", help="Project root for agent-local folders")] = None,
-    all: Annotated[bool, typer.Option("--all", help="Remove all registered skills from agent directories")] = False,
-    force: Annotated[bool, typer.Option("--force", help="Confirm destructive removal")] = False,
-) -> None:
-    """Remove installed skill copies from agent directories."""
-    require_force(force, "desync")
-
-    if all:
-        skills = list_registered_skill_names()
-        if not skills:
-            typer.echo("No registered skills to desync.")
-            raise typer.Exit(0)
-    elif skill_name:
-        skills = [skill_name]
-    else:
-        raise typer.BadParameter("Provide <skill-name> or use --all.")
 
-    desync_skills(skills, parse_agents(agent), project_root_from_option(project))
+def _report_then_raise(messages: list[str], results: list) -> None:
+    """Print the lines of the tasks that succeeded, then re-raise the first failure."""
+    _write_lines([line for line, result in zip(messages, results) if not isinstance(result, Exception)])
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
 
 
-@app.command()
-def where(
-    project: Annotated[Optional[str], typer.Option("--project", help="Project root for agent-local folders")]
-    = None,
+def install_skills(
+    skill_names: list[str],
+    agents: list[str],
+    project_root: Path,
+    *,
+    mode: str = "install",
+    skip_validate: bool = False,
+    link: bool = False,
 ) -> None:
-    """Show registry and agent target locations."""
-    project_root = project_root_from_option(project)
+    if not skill_names:
+        raise _bad_parameter("No skills specified for install")
     targets = agent_targets(project_root)
-    typer.echo(f"registryRoot: {REGISTRY_ROOT}")
-    typer.echo(f"registrySkills: {REGISTRY_SKILLS_DIR}")
-    typer.echo(f"builderPrompt: {BUILDER_PROMPT_PATH}")
-    typer.echo(f"improvePrompt: {IMPROVE_PROMPT_PATH}")
-    typer.echo(f"projectRoot: {project_root}")
-    for agent_name in AGENTS:
-        typer.echo(f"{agent_name}: {targets[agent_name]}")
-
-
-@app.command()
-def prompt() -> None:
-    """Print the builder prompt path."""
-    typer.echo(str(BUILDER_PROMPT_PATH))
-
-
-@app.command()
-def improve(
-    target: Annotated[
-        str, typer.Argument(help="Registered skill name OR local folder path to improve")
-    ],
-    verify_first: Annotated[
-        bool, typer.Option("--verify/--no-verify", help="Run STRICT verification before showing improve instructions")
-    ] = True,
-    verbose: Annotated[bool, typer.Option("--verbose", help="Show full STRICT findings when verifying")] = True,
-    output: Annotated[str, typer.Option("--output", help="Verify output format: pretty, text, json")] = "pretty",
-) -> None:
-    """Prepare improvement of a skill folder (registered or local path) and show the LLM invocation."""
-    ensure_dir(REGISTRY_SKILLS_DIR)
-    skill_dir = resolve_skill_source(target)
-    if not skill_dir.exists() or not skill_dir.is_dir():
-        raise typer.BadParameter(
-            f"Target skill folder not found: {target}. Pass a registered skill name or an existing folder path."
-        )
-
-    target_label = target
-    try:
-        rel = skill_dir.relative_to(REGISTRY_SKILLS_DIR)
-        target_kind = "registered"
-        target_label = rel.as_posix()
-    except ValueError:
-        target_kind = "local-path"
-
-    typer.secho(f"Improve Skill Folder: {target_label}", fg=typer.colors.CYAN, bold=True)
-    typer.echo(f"Target kind: {target_kind}")
-    typer.echo(f"Target folder: {skill_dir}")
-    typer.echo(f"LLM entrypoint: {IMPROVE_PROMPT_PATH} {target}")
-
-    if verify_first:
-        typer.secho("\nPreflight STRICT verify", fg=typer.colors.BRIGHT_BLUE, bold=True)
-        result = verify_skill_directory(skill_dir)
-        _print_verification_report(result, verbose=verbose, output=output)
-        if result.strict_passed:
-            typer.secho(
-                "\nSTRICT already passes. You can still run the improve prompt for refinement if desired.",
-                fg=typer.colors.GREEN,
-            )
-        else:
-            typer.secho(
-                "\nNext step: run the LLM prompt and let it fix STRICT findings in-place.",
-                fg=typer.colors.YELLOW,
-            )
+    _ensure_registry_ready()
+
+    # Duplicate names would race two copies into the same destination.
+    tasks: list[tuple[Path, Path]] = []
+    messages: list[str] = []
+    for skill_name in dict.fromkeys(skill_names):
+        src = registry_skills_dir() / skill_name
+        if not skip_validate:
+            validate_skill_dir(src)
+        for agent in agents:
+            dest = targets[agent] / skill_name
+            tasks.append((src, dest))
+            if mode == "sync":
+                messages.append(f"[sync] updated {skill_name} -> {dest}")
+            else:
+                messages.append(f"[install] {skill_name} -> {agent} ({dest})")
+
+    # One mkdir per distinct agent root, not one per (skill, agent) pair, and only once every
+    # source has validated.
+    for dest_root in {targets[agent] for agent in agents}:
+        ensure_dir(dest_root)
+    # Copies are write-bound; past a handful of workers they only contend for the same disk.
+    results = _run_parallel(
+        functools.partial(copy_dir, link=link), tasks, max_workers=8, return_exceptions=True
+    )
+    _report_then_raise(messages, results)
 
-        if target_kind == "local-path" and result.spec_passed:
-            typer.secho(
-                "\nAfter repair, you can register it with: "
-                f"skills register {skill_dir}",
-                fg=typer.colors.BRIGHT_BLACK,
-            )
 
-    typer.echo(f"\nRun in Gemini/Claude CLI: {IMPROVE_PROMPT_PATH} {target}")
+def desync_skills(skill_names: list[str], agents: list[str], project_root: Path) -> None:
+    if not skill_names:
+        raise _bad_parameter("No skills specified for desync")
+    targets = agent_targets(project_root)
+    tasks = [
+        (skill_name, agent, targets[agent] / skill_name)
+        for skill_name in dict.fromkeys(skill_names)
+        for agent in agents
+    ]
+    removed = _run_parallel(
+        remove_dir_if_exists, [(dest,) for _, _, dest in tasks], return_exceptions=True
+    )
+    _report_then_raise(
+        [
+            f"[desync] removed {skill_name} from {agent} ({dest})"
+            if was_removed
+            else f"[desync] missing {skill_name} in {agent} ({dest})"
+            for (skill_name, agent, dest), was_removed in zip(tasks, removed)
+        ],
+        removed,
+    )
 
 
-@app.command("improve-path")
-def improve_path() -> None:
-    """Print the improve prompt path (low-level helper)."""
-    typer.echo(str(IMPROVE_PROMPT_PATH))
+# Subcommand name -> "module:function". Command bodies live in cli_impl so they are only
+# imported (and introspected by Typer) when a subcommand actually runs.
+_COMMANDS = {
+    "init": "cli_impl:init",
+    "list": "cli_impl:list_cmd",
+    "create": "cli_impl:create",
+    "register": "cli_verify:register",
+    "verify": "cli_verify:verify",
+    "deregister": "cli_impl:deregister",
+    "install": "cli_impl:install",
+    "sync": "cli_impl:sync",
+    "desync": "cli_impl:desync",
+    "where": "cli_impl:where",
+    "prompt": "cli_impl:prompt",
+    "improve": "cli_verify:improve",
+    "improve-path": "cli_impl:improve_path",
+    "improve-prompt": "cli_impl:improve_prompt_legacy",
+}
+
+
+def _root() -> None:
+    pass
+
+
+def _load_command(name: str):
+    """Import the module behind `name` and build its click command."""
+    import importlib
+
+    module_name, attr = _COMMANDS[name].split(":")
+    single = typer.Typer(add_completion=False)
+    single.command(name)(getattr(importlib.import_module(module_name), attr))
+    return typer.main.get_command(single)
+
+
+@functools.cache
+def _lazy_group_class():
+    from difflib import get_close_matches
+
+    from typer.core import TyperGroup
+
+    class LazyTyperGroup(TyperGroup):
+        """Resolves subcommands from `_COMMANDS`, importing a command's module on first use."""
+
+        def list_commands(self, ctx) -> list[str]:
+            return list(_COMMANDS)
+
+        def resolve_command(self, ctx, args):
+            # TyperGroup suggests from `self.commands`, which is empty until a lookup hits, so
+            # report near-misses against `_COMMANDS` here. Option-like tokens and unknown names
+            # with no close match fall through to the stock errors.
+            if args and self.suggest_commands and not ctx.resilient_parsing:
+                name = args[0]
+                normalize = ctx.token_normalize_func
+                known = name in _COMMANDS or (normalize is not None and normalize(name) in _COMMANDS)
+                if not known and not name.startswith("-"):
+                    matches = get_close_matches(name, list(_COMMANDS))
+                    if matches:
+                        suggestions = ", ".join(f"{m!r}" for m in matches)
+                        ctx.fail(f"No such command {name!r}. Did you mean {suggestions}?")
+            return super().resolve_command(ctx, args)
+
+        def get_command(self, ctx, cmd_name: str):
+            if cmd_name not in self.commands and cmd_name in _COMMANDS:
+                self.add_command(_load_command(cmd_name), cmd_name)
+            return self.commands.get(cmd_name)
+
+    return LazyTyperGroup
+
+
+def _build_app():
+    """Build the Typer app; subcommand modules load only when their command is dispatched."""
+    global app
+    _load_typer()
+    app = typer.Typer(cls=_lazy_group_class(), add_completion=False, help="Skills registry CLI (Typer)")
+    # An explicit callback keeps `skills <command>` group semantics with no eager commands.
+    app.callback()(_root)
+    return app
+
+
+# Plain-text `skills --help` served without importing Typer. Each command line is the first
+# docstring line of the function named in _COMMANDS (what Typer shows as its short help); edit
+# them together.
+_FAST_HELP = """\
+Usage: skills [OPTIONS] COMMAND [ARGS]...
+
+  Skills registry CLI (Typer)
+
+Options:
+  --help  Show this message and exit.
+
+Commands:
+  init            Create ~/skills layout and seed skill.build.
+  list            List registered skills.
+  create          Create a minimal skill scaffold in ~/skills/skills/<name>.
+  register        Register one or more skills into ~/skills/skills.
+  verify          Validate a skill folder against the Agent Skills spec checks.
+  deregister      Remove skill(s) from the global registry (~/skills/skills).
+  install         Install registered skill(s) to agent directories.
+  sync            Sync registered skill(s) to agent directories (all if no skill names are provided).
+  desync          Remove installed skill copies from agent directories.
+  where           Show registry and agent target locations.
+  prompt          Print the builder prompt path.
+  improve         Prepare improvement of a skill folder (registered or local path) and show the LLM invocation.
+  improve-path    Print the improve prompt path (low-level helper).
+  improve-prompt  Deprecated alias for `improve-path` (kept for compatibility).
+
+Run `skills COMMAND --help` for command options.
+"""
+
+
+# Subcommands that only print a path; the string getters skip Path construction entirely.
+_FAST_PATHS = {
+    "prompt": builder_prompt_path_str,
+    "improve-path": improve_prompt_path_str,
+    "improve-prompt": improve_prompt_path_str,
+}
+
+
+def _fast_path(argv: list[str]) -> bool:
+    """Handle trivial invocations without importing Typer. Return True if handled."""
+    if argv in (["--help"], ["-h"]):
+        sys.stdout.write(_FAST_HELP)
+        return True
+    if argv == ["--version"]:
+        print(f"skills {__version__}")
+        return True
+    if argv == ["where"]:
+        print("\n".join(_where_lines(project_root_from_option(None))))
+        return True
+    if len(argv) == 1 and argv[0] in _FAST_PATHS:
+        sys.stdout.write(_FAST_PATHS[argv[0]]() + "\n")
+        return True
+    return False
 
 
-@app.command("improve-prompt")
-def improve_prompt_legacy() -> None:
-    """Deprecated alias for `improve-path` (kept for compatibility)."""
-    typer.echo(str(IMPROVE_PROMPT_PATH))
+def main() -> None:
+    try:
+        if _fast_path(sys.argv[1:]):
+            return
+    except BrokenPipeError:
+        # Same as Click: a closed stdout pipe (e.g. `| head`) exits quietly.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise SystemExit(1)
+    _build_app()()
 
 
 if __name__ == "__main__":
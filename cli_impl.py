@@ -0,0 +1,247 @@
+"""Typer command bodies for the skills CLI, imported by `cli` only when a subcommand runs.
+
+The verification-backed commands (register, verify, improve) live in `cli_verify`.
+"""
+from __future__ import annotations
+
+from cli import (
+    _ensure_registry_ready,
+    _load_typer,
+    _where_lines,
+    _write_lines,
+    builder_prompt_path,
+    builder_prompt_path_str,
+    default_builder_prompt,
+    default_improve_prompt,
+    desync_skills,
+    ensure_dir,
+    improve_prompt_path,
+    improve_prompt_path_str,
+    install_skills,
+    list_registered_skill_names,
+    normalize_skill_name,
+    parse_agents,
+    project_root_from_option,
+    registry_skills_dir,
+    remove_dir_if_exists,
+    require_force,
+    write_file_bytes,
+)
+
+typer = _load_typer()
+
+
+def init(
+    force_prompt: bool = typer.Option(False, "--force-prompt", help="Rewrite ~/skills/skill.build"),
+    force_improve_prompt: bool = typer.Option(
+        False, "--force-improve-prompt", help="Rewrite ~/skills/skill.improve"
+    ),
+) -> None:
+    """Create ~/skills layout and seed skill.build."""
+    _ensure_registry_ready()
+
+    builder_prompt = builder_prompt_path()
+    if force_prompt or not builder_prompt.exists():
+        write_file_bytes(builder_prompt, default_builder_prompt().encode("utf-8"))
+        typer.echo(f"Wrote prompt: {builder_prompt}")
+    else:
+        typer.echo(f"Prompt exists: {builder_prompt}")
+
+    improve_prompt = improve_prompt_path()
+    if force_improve_prompt or not improve_prompt.exists():
+        write_file_bytes(improve_prompt, default_improve_prompt().encode("utf-8"))
+        typer.echo(f"Wrote improve prompt: {improve_prompt}")
+    else:
+        typer.echo(f"Improve prompt exists: {improve_prompt}")
+
+    typer.echo(f"Registry skills dir: {registry_skills_dir()}")
+
+
+def list_cmd() -> None:
+    """List registered skills."""
+    skills = list_registered_skill_names()
+    if not skills:
+        typer.echo("No registered skills found.")
+        return
+    _write_lines(skills)
+
+
+def create(
+    name: str = typer.Argument(..., help="Skill name (used as folder name)"),
+    force: bool = typer.Option(False, "--force", help="Overwrite existing registry skill folder"),
+) -> None:
+    """Create a minimal skill scaffold in ~/skills/skills/<name>."""
+    _ensure_registry_ready()
+
+    skill_name = normalize_skill_name(name)
+    if not skill_name:
+        raise typer.BadParameter("Skill name is empty after normalization")
+
+    skill_dir = registry_skills_dir() / skill_name
+    references_dir = skill_dir / "references"
+    misc_references_dir = references_dir / "misc"
+    skill_md = skill_dir / "SKILL.md"
+
+    if skill_dir.exists():
+        if not force:
+            raise typer.BadParameter(
+                f"Skill already exists: {skill_dir}. Use --force to overwrite."
+            )
+        import shutil
+
+        shutil.rmtree(skill_dir)
+
+    ensure_dir(misc_references_dir)
+    skill_md.write_text(
+        (
+            "---\n"
+            f"name: {skill_name}\n"
+            "description: >-\n"
+            f"  Describe what the `{skill_name}` skill does and when to use it.\n"
+            "triggers:\n"
+            f"  - {skill_name}\n"
+            "references:\n"
+            "  - references/misc/overview.md\n"
+            "compatibility: \"Add supported versions/platforms here\"\n"
+            "metadata:\n"
+            "  skill_version: \"0.1.0\"\n"
+            "  owner: \"\"\n"
+            "activation:\n"
+            "  mode: fuzzy\n"
+            "  triggers:\n"
+            f"    - {skill_name}\n"
+            "  priority: normal\n"
+            "---\n\n"
+            "# Skill Instructions\n\n"
+            "Keep this file focused on critical setup rules and invariants only.\n\n"
+            "## Critical Rules\n\n"
+            "1. Replace this scaffold with the actual setup constraints.\n"
+            "2. Move detailed docs/examples into `references/` files.\n"
+        ),
+        encoding="utf-8",
+    )
+    (misc_references_dir / "overview.md").write_text(
+        (
+            f"# {skill_name} Reference\n\n"
+            "Add detailed documentation, examples, API notes, and patterns here.\n"
+        ),
+        encoding="utf-8",
+    )
+
+    typer.echo(f"[create] scaffolded {skill_dir}")
+    typer.echo(f"[create] edit {skill_md}")
+
+
+def deregister(
+    skill_name: str | None = typer.Argument(None, help="Registered skill name"),
+    all: bool = typer.Option(False, "--all", help="Remove all registered skills from registry"),
+    force: bool = typer.Option(False, "--force", help="Confirm destructive removal"),
+) -> None:
+    """Remove skill(s) from the global registry (~/skills/skills)."""
+    require_force(force, "deregister")
+    _ensure_registry_ready()
+
+    if all:
+        names = list_registered_skill_names()
+        if not names:
+            typer.echo("No registered skills to deregister.")
+            raise typer.Exit(0)
+    elif skill_name:
+        names = [skill_name]
+    else:
+        raise typer.BadParameter("Provide <skill-name> or use --all.")
+
+    for name in names:
+        target = registry_skills_dir() / name
+        if remove_dir_if_exists(target):
+            typer.echo(f"[deregister] removed {target}")
+        else:
+            typer.echo(f"[deregister] missing {target}")
+
+
+def install(
+    skill_name: str | None = typer.Argument(None, help="Registered skill name"),
+    agent: list[str] = typer.Option([], "--agent", help="Agent(s): codex,claude,kiro,gemini,antigravity,all"),
+    project: str | None = typer.Option(None, "--project", help="Project root for agent-local folders"),
+    all: bool = typer.Option(False, "--all", help="Install all registered skills"),
+    link: bool = typer.Option(
+        False,
+        "--link",
+        help="Hard-link files from the registry instead of copying them (edits on either side then show up in both)",
+    ),
+) -> None:
+    """Install registered skill(s) to agent directories."""
+    if all or skill_name is None:
+        skills = list_registered_skill_names()
+        if not skills:
+            typer.echo("No registered skills to install.")
+            raise typer.Exit(0)
+    else:
+        skills = [skill_name]
+
+    install_skills(skills, parse_agents(agent), project_root_from_option(project), link=link)
+
+
+def sync(
+    skill_names: list[str] = typer.Argument(
+        [], help="Optional registered skill names to sync (defaults to all if omitted)"
+    ),
+    agent: list[str] = typer.Option([], "--agent", help="Agent(s): codex,claude,kiro,gemini,antigravity,all"),
+    project: str | None = typer.Option(None, "--project", help="Project root for agent-local folders"),
+    link: bool = typer.Option(
+        False,
+        "--link",
+        help="Hard-link files from the registry instead of copying them (edits on either side then show up in both)",
+    ),
+) -> None:
+    """Sync registered skill(s) to agent directories (all if no skill names are provided)."""
+    skills = skill_names or list_registered_skill_names()
+    if not skills:
+        typer.echo("No registered skills to sync.")
+        raise typer.Exit(0)
+    install_skills(skills, parse_agents(agent), project_root_from_option(project), mode="sync", link=link)
+
+
+def desync(
+    skill_name: str | None = typer.Argument(None, help="Installed/registered skill name"),
+    agent: list[str] = typer.Option([], "--agent", help="Agent(s): codex,claude,kiro,gemini,antigravity,all"),
+    project: str | None = typer.Option(None, "--project", help="Project root for agent-local folders"),
+    all: bool = typer.Option(False, "--all", help="Remove all registered skills from agent directories"),
+    force: bool = typer.Option(False, "--force", help="Confirm destructive removal"),
+) -> None:
+    """Remove installed skill copies from agent directories."""
+    require_force(force, "desync")
+
+    if all:
+        skills = list_registered_skill_names()
+        if not skills:
+            typer.echo("No registered skills to desync.")
+            raise typer.Exit(0)
+    elif skill_name:
+        skills = [skill_name]
+    else:
+        raise typer.BadParameter("Provide <skill-name> or use --all.")
+
+    desync_skills(skills, parse_agents(agent), project_root_from_option(project))
+
+
+def where(
+    project: str | None = typer.Option(None, "--project", help="Project root for agent-local folders"),
+) -> None:
+    """Show registry and agent target locations."""
+    _write_lines(_where_lines(project_root_from_option(project)))
+
+
+def prompt() -> None:
+    """Print the builder prompt path."""
+    typer.echo(builder_prompt_path_str())
+
+
+def improve_path() -> None:
+    """Print the improve prompt path (low-level helper)."""
+    typer.echo(improve_prompt_path_str())
+
+
+def improve_prompt_legacy() -> None:
+    """Deprecated alias for `improve-path` (kept for compatibility)."""
+    typer.echo(improve_prompt_path_str())
@@ -0,0 +1,417 @@
+"""Verification-backed commands (register, verify, improve) and their report rendering."""
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from itertools import chain
+from pathlib import Path
+
+from cli import (
+    _ensure_registry_ready,
+    _load_typer,
+    copy_dir,
+    expand_home,
+    find_skill_folders_in_dir,
+    has_skill_file,
+    improve_prompt_path,
+    install_skills,
+    parse_agents,
+    project_root_from_option,
+    registry_skills_dir,
+    resolve_skill_source,
+)
+
+typer = _load_typer()
+
+
+def _parse_gate(gate: str) -> bool:
+    """Validate `--gate` once and return True for the strict gate."""
+    gate = gate.lower().strip()
+    if gate not in {"spec", "strict"}:
+        raise typer.BadParameter("`--gate` must be `spec` or `strict`.")
+    return gate == "strict"
+
+
+@functools.cache
+def _stdout_is_tty() -> bool:
+    return sys.stdout.isatty()
+
+
+def _emit(message: str, *, fg: str | None = None, bold: bool = False) -> None:
+    """`typer.secho` on a terminal, plain `typer.echo` otherwise (click would strip the codes)."""
+    if fg and _stdout_is_tty():
+        typer.secho(message, fg=fg, bold=bold)
+    else:
+        typer.echo(message)
+
+
+# Indexed by the `passed` bool: False -> 0, True -> 1.
+_STATUS_TEXT = ("FAIL", "PASS")
+_STATUS_COLOR = ("red", "green")
+
+
+def _render_issue_group(title: str, errors, warnings) -> None:
+    if not errors and not warnings:
+        return
+    _emit(f"\n{title}", fg=typer.colors.BRIGHT_BLUE, bold=True)
+    for issue in errors:
+        _emit(f"  [ERROR] {issue.message}", fg=typer.colors.RED)
+    for issue in warnings:
+        _emit(f"  [WARN]  {issue.message}", fg=typer.colors.YELLOW)
+
+
+def _verification_payload(result, verbose: bool = False) -> dict:
+    payload = {
+        "skill_dir": str(result.skill_dir),
+        "grades": {
+            "spec": {"score": result.spec_grade, "status": _STATUS_TEXT[result.spec_passed]},
+            "strict": {
+                "score": result.strict_grade,
+                "status": _STATUS_TEXT[result.strict_passed],
+                "threshold": result.strict_threshold,
+            },
+        },
+        "counts": {
+            "spec": {"errors": len(result.spec_errors), "warnings": len(result.spec_warnings)},
+            "strict": {"errors": len(result.errors), "warnings": len(result.warnings)},
+        },
+    }
+    if verbose:
+        payload["findings"] = {
+            "spec": {
+                "errors": [i.message for i in result.spec_errors],
+                "warnings": [i.message for i in result.spec_warnings],
+            },
+            "strict": {
+                "errors": [i.message for i in result.errors],
+                "warnings": [i.message for i in result.warnings],
+            },
+        }
+    return payload
+
+
+def _json_dumps(payload: dict) -> str:
+    # orjson is optional; when installed it serializes the report several times faster. The
+    # fallback keeps non-ASCII unescaped like orjson, so the output bytes match either way.
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        import json
+
+        return json.dumps(payload, indent=2, ensure_ascii=False)
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _print_verification_report_text(result, verbose: bool = False) -> None:
+    p = _verification_payload(result, verbose=verbose)
+    typer.echo(f"[verify] {p['skill_dir']}")
+    typer.echo(
+        f"[verify] SPEC   grade={p['grades']['spec']['score']}/100 status={p['grades']['spec']['status']} "
+        f"errors={p['counts']['spec']['errors']} warnings={p['counts']['spec']['warnings']}"
+    )
+    typer.echo(
+        f"[verify] STRICT grade={p['grades']['strict']['score']}/100 status={p['grades']['strict']['status']} "
+        f"threshold={p['grades']['strict']['threshold']} "
+        f"errors={p['counts']['strict']['errors']} warnings={p['counts']['strict']['warnings']}"
+    )
+    if not verbose:
+        if any([p["counts"]["spec"]["errors"], p["counts"]["spec"]["warnings"], p["counts"]["strict"]["errors"], p["counts"]["strict"]["warnings"]]):
+            typer.echo("[verify] Use --verbose for full findings.")
+        return
+    findings = p.get("findings", {})
+    for scope in ("spec", "strict"):
+        f = findings.get(scope, {})
+        if not f.get("errors") and not f.get("warnings"):
+            continue
+        typer.echo(f"[verify] {scope.upper()} Findings")
+        for msg in f.get("errors", []):
+            typer.echo(f"  {scope.upper()} ERROR: {msg}")
+        for msg in f.get("warnings", []):
+            typer.echo(f"  {scope.upper()} WARN: {msg}")
+
+
+def _print_verification_report(result, verbose: bool = False, output: str = "pretty") -> None:
+    output = output.lower().strip()
+    if output not in {"pretty", "text", "json"}:
+        raise typer.BadParameter("`--output` must be `pretty`, `text`, or `json`.")
+    if output == "json":
+        typer.echo(_json_dumps(_verification_payload(result, verbose=verbose)))
+        return
+    if output == "text":
+        _print_verification_report_text(result, verbose=verbose)
+        return
+
+    _emit(f"\nVerify: {result.skill_dir}", fg=typer.colors.CYAN, bold=True)
+    typer.echo("-" * 72)
+
+    typer.echo("Grades")
+    _emit(
+        f"  SPEC   : {_STATUS_TEXT[result.spec_passed]}  ({result.spec_grade}/100)",
+        fg=_STATUS_COLOR[result.spec_passed],
+        bold=result.spec_passed,
+    )
+    strict_text = (
+        f"  STRICT : {_STATUS_TEXT[result.strict_passed]}  "
+        f"({result.strict_grade}/100, threshold={result.strict_threshold})"
+    )
+    _emit(
+        strict_text,
+        fg=_STATUS_COLOR[result.strict_passed],
+        bold=result.strict_passed,
+    )
+    typer.echo(
+        f"Counts  SPEC(e={len(result.spec_errors)}, w={len(result.spec_warnings)})  "
+        f"STRICT(e={len(result.errors)}, w={len(result.warnings)})"
+    )
+
+    if not result.spec_issues and not result.issues:
+        _emit("\nNo findings.", fg=typer.colors.GREEN)
+        return
+
+    if not verbose:
+        if result.spec_errors or result.errors:
+            seen = set()
+            merged_errors = []
+            for issue in chain(result.spec_errors, result.errors):
+                key = issue.message
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged_errors.append(issue)
+            _render_issue_group("Errors", merged_errors, [])
+        _emit(
+            "\nTip: Use --verbose for full spec/strict warnings and grouped findings.",
+            fg=typer.colors.BRIGHT_BLACK,
+        )
+        return
+
+    _render_issue_group("Spec Findings", result.spec_errors, result.spec_warnings)
+    _render_issue_group("Strict Findings", result.errors, result.warnings)
+
+
+def register(
+    sources: list[str] = typer.Argument(
+        [],
+        help=(
+            "Path(s) to skill folder(s). "
+            "Pass '.' to discover all skill subfolders in the current directory. "
+            "Multiple paths are accepted: skills register path1 path2 path3"
+        ),
+    ),
+    name: str | None = typer.Option(
+        None, "--name", help="Override registry folder name (single skill only)"
+    ),
+    install: bool = typer.Option(False, "--install", help="Install to agent directories after register"),
+    agent: list[str] = typer.Option([], "--agent", help="Agent(s): codex,claude,kiro,gemini,antigravity,all"),
+    project: str | None = typer.Option(None, "--project", help="Project root for agent-local folders"),
+    gate: str = typer.Option("spec", "--gate", help="Registration gate: spec or strict"),
+    verbose: bool = typer.Option(False, "--verbose", help="Show full verification findings"),
+    output: str = typer.Option("pretty", "--output", help="Verification output format: pretty, text, json"),
+) -> None:
+    """Register one or more skills into ~/skills/skills.
+
+    Pass '.' to discover and register all skill subfolders in the current directory.
+    Multiple explicit paths are also accepted.
+    """
+    raw_sources = list(sources)
+    if not raw_sources:
+        raw_sources = [typer.prompt("Skill source folder path")]
+
+    if name and len(raw_sources) > 1:
+        raise typer.BadParameter("--name cannot be used when registering multiple skills.")
+
+    # Expand each source: directories without a skill file trigger discovery of subfolders
+    resolved: list[Path] = []
+    for src in raw_sources:
+        p = expand_home(src)
+        if p is None:
+            raise typer.BadParameter(f"Invalid path: {src}")
+        # Canonical paths: the registry folder is named after `.name`, which must never be `..`
+        # or a symlink's name while verification checks the target directory.
+        p = p.resolve()
+        if p.is_dir() and not has_skill_file(p):
+            discovered = find_skill_folders_in_dir(p)
+            if not discovered:
+                _emit(f"[register] No skill folders found in: {p}", fg=typer.colors.YELLOW)
+            else:
+                typer.echo(f"[register] Discovered {len(discovered)} skill folder(s) in: {p}")
+                resolved.extend(folder.resolve() for folder in discovered)
+        else:
+            resolved.append(p)
+
+    if not resolved:
+        raise typer.BadParameter("No skill source paths resolved.")
+
+    from verification import verify_skill_directory
+
+    want_strict = _parse_gate(gate)
+    batch = len(resolved) > 1
+    project_root = project_root_from_option(project)
+    agents = parse_agents(agent)
+    success_count = 0
+    fail_count = 0
+
+    for src_path in resolved:
+        if batch:
+            _emit(f"\n--- {src_path.name} ---", fg=typer.colors.CYAN)
+
+        verification = verify_skill_directory(src_path)
+        _print_verification_report(verification, verbose=verbose, output=output)
+
+        if not (verification.strict_passed if want_strict else verification.spec_passed):
+            if batch:
+                _emit(
+                    f"[register] Skipped {src_path.name} (failed `{gate}` gate).",
+                    fg=typer.colors.YELLOW,
+                )
+                fail_count += 1
+                continue
+            _emit(
+                f"\nRegistration blocked by `{gate}` gate.",
+                fg=typer.colors.RED,
+                bold=True,
+            )
+            _emit(
+                f"Repair path: run `skills improve {src_path}` and fix the folder in-place, then register again.",
+                fg=typer.colors.YELLOW,
+            )
+            raise typer.Exit(code=1)
+
+        skill_name = (name or src_path.name).strip()
+        if not skill_name:
+            if batch:
+                _emit(
+                    f"[register] Skipped: resolved skill name is empty for {src_path}",
+                    fg=typer.colors.YELLOW,
+                )
+                fail_count += 1
+                continue
+            raise typer.BadParameter("Resolved skill name is empty")
+        if skill_name in (".", "..") or os.sep in skill_name or (os.altsep and os.altsep in skill_name):
+            # Anything but a single path component would put `dest` outside the registry.
+            if batch:
+                _emit(
+                    f"[register] Skipped: invalid skill name `{skill_name}` for {src_path}",
+                    fg=typer.colors.YELLOW,
+                )
+                fail_count += 1
+                continue
+            raise typer.BadParameter(f"Invalid skill name: {skill_name}")
+
+        frontmatter_name = verification.get_frontmatter_name()
+        if frontmatter_name and name and skill_name != frontmatter_name:
+            if batch:
+                _emit(
+                    f"[register] Skipped {src_path.name}: --name ({skill_name}) does not match "
+                    f"SKILL.md name ({frontmatter_name}).",
+                    fg=typer.colors.YELLOW,
+                )
+                fail_count += 1
+                continue
+            raise typer.BadParameter(
+                f"--name ({skill_name}) must match SKILL.md frontmatter name ({frontmatter_name}) to remain spec-compliant."
+            )
+
+        _ensure_registry_ready()
+        dest = registry_skills_dir() / skill_name
+        copy_dir(src_path, dest)
+        typer.echo(f"[register] {src_path} -> {dest}")
+        success_count += 1
+
+        if install:
+            # The registry copy was just verified and written above.
+            install_skills([skill_name], agents, project_root, skip_validate=True)
+
+    if batch:
+        typer.echo(f"\n[register] Done: {success_count} registered, {fail_count} skipped.")
+        if fail_count > 0:
+            raise typer.Exit(code=1)
+
+
+def verify(
+    source: str = typer.Argument(..., help="Path to a skill folder OR registered skill name"),
+    gate: str = typer.Option("spec", "--gate", help="Exit-code gate: spec or strict"),
+    strict: bool = typer.Option(False, "--strict", help="Shortcut for --gate strict"),
+    verbose: bool = typer.Option(False, "--verbose", help="Show full verification findings"),
+    output: str = typer.Option("pretty", "--output", help="Output format: pretty, text, json"),
+) -> None:
+    """Validate a skill folder against the Agent Skills spec checks."""
+    from verification import verify_skill_directory
+
+    src_path = resolve_skill_source(source)
+    if src_path is None:
+        raise typer.BadParameter("Missing source path")
+    want_strict = strict or _parse_gate(gate)
+    result = verify_skill_directory(src_path)
+    _print_verification_report(result, verbose=verbose, output=output)
+    if not (result.strict_passed if want_strict else result.spec_passed):
+        raise typer.Exit(code=1)
+
+
+def improve(
+    target: str = typer.Argument(..., help="Registered skill name OR local folder path to improve"),
+    verify_first: bool | None = typer.Option(
+        None,
+        "--verify/--no-verify",
+        help=(
+            "Run STRICT verification before showing improve instructions "
+            "(default: on, except when pretty output is piped to another process)"
+        ),
+        show_default=False,
+    ),
+    verbose: bool = typer.Option(True, "--verbose", help="Show full STRICT findings when verifying"),
+    output: str = typer.Option("pretty", "--output", help="Verify output format: pretty, text, json"),
+) -> None:
+    """Prepare improvement of a skill folder (registered or local path) and show the LLM invocation."""
+    _ensure_registry_ready()
+    skill_dir = resolve_skill_source(target)
+    if not skill_dir.exists() or not skill_dir.is_dir():
+        raise typer.BadParameter(
+            f"Target skill folder not found: {target}. Pass a registered skill name or an existing folder path."
+        )
+
+    # Lexical prefix test; relative_to() would raise and catch on every local path.
+    registry_prefix = os.path.join(registry_skills_dir(), "")
+    skill_path = os.fspath(skill_dir)
+    if skill_path.startswith(registry_prefix):
+        target_kind = "registered"
+        target_label = skill_path[len(registry_prefix):].replace(os.sep, "/")
+    else:
+        target_kind = "local-path"
+        target_label = target
+
+    _emit(f"Improve Skill Folder: {target_label}", fg=typer.colors.CYAN, bold=True)
+    typer.echo(f"Target kind: {target_kind}")
+    typer.echo(f"Target folder: {skill_dir}")
+    typer.echo(f"LLM entrypoint: {improve_prompt_path()} {target}")
+
+    if verify_first is None:
+        # Piped pretty output is read for the final invocation line; skip the tree walk there.
+        verify_first = output.lower().strip() != "pretty" or _stdout_is_tty()
+    if verify_first:
+        from verification import verify_skill_directory
+
+        _emit("\nPreflight STRICT verify", fg=typer.colors.BRIGHT_BLUE, bold=True)
+        result = verify_skill_directory(skill_dir)
+        _print_verification_report(result, verbose=verbose, output=output)
+        if result.strict_passed:
+            _emit(
+                "\nSTRICT already passes. You can still run the improve prompt for refinement if desired.",
+                fg=typer.colors.GREEN,
+            )
+        else:
+            _emit(
+                "\nNext step: run the LLM prompt and let it fix STRICT findings in-place.",
+                fg=typer.colors.YELLOW,
+            )
+
+        if target_kind == "local-path" and result.spec_passed:
+            _emit(
+                "\nAfter repair, you can register it with: "
+                f"skills register {skill_dir}",
+                fg=typer.colors.BRIGHT_BLACK,
+            )
+
+    typer.echo(f"\nRun in Gemini/Claude CLI: {improve_prompt_path()} {target}")
+
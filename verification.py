@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import codecs
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 import re
@@ -7,11 +9,27 @@ from typing import Any
 
 import yaml
 
-
-NAME_RE = re.compile(r"^[a-z0-9-]{1,64}$")
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _SafeLoader
+
+
+NAME_RE = re.compile(r"^[a-z0-9-]{1,64}$", re.ASCII)
+_name_fullmatch = NAME_RE.fullmatch
+_YAML_AT_RE = re.compile(r"^\s*-\s+@")
+_DIGITS = frozenset("0123456789")
+# Everything str.splitlines() treats as a line boundary besides \n and \r.
+_OTHER_LINE_BREAKS_RE = re.compile("[\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+_LINE_BREAK_CHARS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+# Opening and closing `---` lines (surrounding whitespace allowed, as with str.strip()). The
+# lazy `??` tries the closing fence first, so `.*?` stops at the first fence line.
+_FRONTMATTER_RE = re.compile(
+    r"\A[^\S\n]*---[^\S\n]*\n(?:(.*?)\n)??[^\S\n]*---[^\S\n]*(?:\n|\Z)", re.DOTALL
+)
 OPTIONAL_DIRS = ("scripts", "references", "assets")
 WORKFLOW_ALLOWED_TOPLEVEL = {"SKILL.md", "references", "scripts", "assets", "agents"}
-WORKFLOW_REFERENCE_TAXONOMY = {
+WORKFLOW_REFERENCE_TAXONOMY = frozenset({
     "api",
     "hooks",
     "types",
@@ -22,16 +40,21 @@ WORKFLOW_REFERENCE_TAXONOMY = {
     "validation",
     "examples",
     "misc",
-}
+})
+# Shared level objects; `==` on the same object short-circuits on identity. Issues rebuilt by
+# pickle or copy carry equal but distinct strings, so never use `is`.
+_LVL_ERROR = "error"
+_LVL_WARNING = "warning"
+_WORKFLOW_REFERENCE_TAXONOMY_ALLOWED = ", ".join(sorted(WORKFLOW_REFERENCE_TAXONOMY))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerificationIssue:
     level: str
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     skill_dir: Path
     skill_md_path: Path
@@ -46,37 +69,62 @@ class VerificationResult:
     strict_passed: bool = False
     strict_threshold: int = 80
 
+    # Kept up to date by the add_* methods so grading never has to re-filter the issue lists.
+    _error_count: int = field(default=0, init=False, repr=False, compare=False)
+    _warning_count: int = field(default=0, init=False, repr=False, compare=False)
+    _spec_error_count: int = field(default=0, init=False, repr=False, compare=False)
+    _spec_warning_count: int = field(default=0, init=False, repr=False, compare=False)
+
     @property
     def errors(self) -> list[VerificationIssue]:
-        return [i for i in self.issues if i.level == "error"]
+        return [i for i in self.issues if i.level == _LVL_ERROR]
 
     @property
     def warnings(self) -> list[VerificationIssue]:
-        return [i for i in self.issues if i.level == "warning"]
+        return [i for i in self.issues if i.level == _LVL_WARNING]
 
     @property
     def is_valid(self) -> bool:
         return self.spec_passed
 
     def add_error(self, message: str) -> None:
-        self.issues.append(VerificationIssue(level="error", message=message))
+        self.issues.append(VerificationIssue(level=_LVL_ERROR, message=message))
+        self._error_count += 1
 
     def add_warning(self, message: str) -> None:
-        self.issues.append(VerificationIssue(level="warning", message=message))
+        self.issues.append(VerificationIssue(level=_LVL_WARNING, message=message))
+        self._warning_count += 1
 
     def add_spec_error(self, message: str) -> None:
-        self.spec_issues.append(VerificationIssue(level="error", message=message))
+        self.spec_issues.append(VerificationIssue(level=_LVL_ERROR, message=message))
+        self._spec_error_count += 1
 
     def add_spec_warning(self, message: str) -> None:
-        self.spec_issues.append(VerificationIssue(level="warning", message=message))
+        self.spec_issues.append(VerificationIssue(level=_LVL_WARNING, message=message))
+        self._spec_warning_count += 1
+
+    def add_shared_error(self, message: str) -> None:
+        # Findings that the spec and strict checks report identically.
+        issue = VerificationIssue(level=_LVL_ERROR, message=message)
+        self.issues.append(issue)
+        self.spec_issues.append(issue)
+        self._error_count += 1
+        self._spec_error_count += 1
+
+    def add_shared_warning(self, message: str) -> None:
+        issue = VerificationIssue(level=_LVL_WARNING, message=message)
+        self.issues.append(issue)
+        self.spec_issues.append(issue)
+        self._warning_count += 1
+        self._spec_warning_count += 1
 
     @property
     def spec_errors(self) -> list[VerificationIssue]:
-        return [i for i in self.spec_issues if i.level == "error"]
+        return [i for i in self.spec_issues if i.level == _LVL_ERROR]
 
     @property
     def spec_warnings(self) -> list[VerificationIssue]:
-        return [i for i in self.spec_issues if i.level == "warning"]
+        return [i for i in self.spec_issues if i.level == _LVL_WARNING]
 
     def get_frontmatter_name(self) -> str | None:
         if not isinstance(self.frontmatter, dict):
@@ -85,7 +133,38 @@ class VerificationResult:
         return value if isinstance(value, str) else None
 
 
+def _has_other_line_breaks(text: str) -> bool:
+    # ASCII text can only hold the \v \f \x1c-\x1e breaks; a few substring probes beat a regex scan.
+    if text.isascii():
+        return any(ch in text for ch in "\v\f\x1c\x1d\x1e")
+    return _OTHER_LINE_BREAKS_RE.search(text) is not None
+
+
+def _load_yaml(text: str) -> Any:
+    try:
+        return yaml.load(text, Loader=_SafeLoader)
+    except yaml.YAMLError:
+        if _SafeLoader is yaml.SafeLoader:
+            raise
+        # LibYAML errors carry no source snippet; re-parse in Python for the readable message.
+        return yaml.safe_load(text)
+
+
 def _split_frontmatter(text: str) -> tuple[str, str] | None:
+    if "\r" in text or _has_other_line_breaks(text):
+        return _split_frontmatter_lines(text)
+    # Plain \n text: one anchored match instead of materializing every line.
+    match = _FRONTMATTER_RE.match(text)
+    if match is None:
+        return None
+    # splitlines() + join drop one trailing newline from the body; keep doing the same.
+    body = text[match.end():]
+    if body.endswith("\n"):
+        body = body[:-1]
+    return match.group(1) or "", body
+
+
+def _split_frontmatter_lines(text: str) -> tuple[str, str] | None:
     lines = text.splitlines()
     if not lines or lines[0].strip() != "---":
         return None
@@ -99,41 +178,44 @@ def _split_frontmatter(text: str) -> tuple[str, str] | None:
 
 def _validate_name(value: Any, parent_dir_name: str, result: VerificationResult) -> None:
     if not isinstance(value, str):
-        result.add_error("Frontmatter field `name` is required and must be a string.")
+        result.add_shared_error("Frontmatter field `name` is required and must be a string.")
         return
 
     if len(value) == 0 or len(value) > 64:
-        result.add_error("`name` must be 1-64 characters.")
+        result.add_shared_error("`name` must be 1-64 characters.")
 
-    if not NAME_RE.fullmatch(value):
-        result.add_error(
+    if not _name_fullmatch(value):
+        result.add_shared_error(
             "`name` must contain only lowercase letters, numbers, and hyphens."
         )
 
     if value.startswith("-") or value.endswith("-"):
-        result.add_error("`name` must not start or end with `-`.")
+        result.add_shared_error("`name` must not start or end with `-`.")
 
     if "--" in value:
-        result.add_error("`name` must not contain consecutive hyphens (`--`).")
+        result.add_shared_error("`name` must not contain consecutive hyphens (`--`).")
 
     if value != parent_dir_name:
-        result.add_error(
+        result.add_shared_error(
             f"`name` ({value}) must match the parent directory name ({parent_dir_name})."
         )
 
 
 def _validate_description(value: Any, result: VerificationResult) -> None:
     if not isinstance(value, str):
-        result.add_error("Frontmatter field `description` is required and must be a string.")
+        result.add_shared_error("Frontmatter field `description` is required and must be a string.")
         return
 
     length = len(value.strip())
     if length == 0 or length > 1024:
-        result.add_error("`description` must be non-empty and at most 1024 characters.")
+        result.add_shared_error("`description` must be non-empty and at most 1024 characters.")
     elif length < 20:
         result.add_warning(
             "`description` is very short; Agent Skills spec recommends describing what the skill does and when to use it."
         )
+        result.add_spec_warning(
+            "`description` is very short; include what the skill does and when to use it."
+        )
 
 
 def _validate_optional_string_field(
@@ -142,41 +224,29 @@ def _validate_optional_string_field(
     if value is None:
         return
     if not isinstance(value, str):
-        result.add_error(f"`{key}` must be a string if provided.")
+        result.add_shared_error(f"`{key}` must be a string if provided.")
         return
     trimmed = value.strip()
     if key == "compatibility" and len(trimmed) == 0:
-        result.add_error("`compatibility` must be 1-500 characters if provided.")
+        result.add_shared_error("`compatibility` must be 1-500 characters if provided.")
         return
     if max_len is not None and len(trimmed) > max_len:
-        result.add_error(f"`{key}` must be at most {max_len} characters.")
+        result.add_shared_error(f"`{key}` must be at most {max_len} characters.")
 
 
 def _validate_metadata(value: Any, result: VerificationResult) -> None:
     if value is None:
         return
     if not isinstance(value, dict):
-        result.add_error("`metadata` must be a key-value mapping if provided.")
+        result.add_shared_error("`metadata` must be a key-value mapping if provided.")
         return
     for k, v in value.items():
         if not isinstance(k, str):
-            result.add_error("`metadata` keys must be strings.")
+            result.add_shared_error("`metadata` keys must be strings.")
         if not isinstance(v, str):
             result.add_warning(
                 f"`metadata.{k}` is structured (non-string). Agent Skills spec prefers string metadata values, but this workflow currently allows richer metadata."
             )
-
-
-def _validate_metadata_spec(value: Any, result: VerificationResult) -> None:
-    if value is None:
-        return
-    if not isinstance(value, dict):
-        result.add_spec_error("`metadata` must be a key-value mapping if provided.")
-        return
-    for k, v in value.items():
-        if not isinstance(k, str):
-            result.add_spec_error("`metadata` keys must be strings.")
-        if not isinstance(v, str):
             result.add_spec_warning(
                 f"`metadata.{k}` is structured (non-string). Spec-oriented tooling may expect string metadata values."
             )
@@ -186,20 +256,10 @@ def _validate_allowed_tools(value: Any, result: VerificationResult) -> None:
     if value is None:
         return
     if not isinstance(value, str):
-        result.add_error("`allowed-tools` must be a space-delimited string if provided.")
+        result.add_shared_error("`allowed-tools` must be a space-delimited string if provided.")
         return
     if len(value.strip()) == 0:
-        result.add_error("`allowed-tools` must not be empty if provided.")
-
-
-def _validate_allowed_tools_spec(value: Any, result: VerificationResult) -> None:
-    if value is None:
-        return
-    if not isinstance(value, str):
-        result.add_spec_error("`allowed-tools` must be a space-delimited string if provided.")
-        return
-    if len(value.strip()) == 0:
-        result.add_spec_error("`allowed-tools` must not be empty if provided.")
+        result.add_shared_error("`allowed-tools` must not be empty if provided.")
 
 
 def _validate_optional_dirs(skill_dir: Path, result: VerificationResult) -> None:
@@ -211,11 +271,13 @@ def _validate_optional_dirs(skill_dir: Path, result: VerificationResult) -> None
 
 def _validate_yaml_frontmatter_safety(frontmatter_text: str, result: VerificationResult) -> None:
     # Workflow rule from ~/skill.build: quote scalars that start with @ (especially trigger items).
-    for line in frontmatter_text.splitlines():
-        if re.match(r"^\s*-\s+@", line):
-            result.add_error(
-                "YAML frontmatter safety rule violated: quote trigger/scalar values starting with `@` (use `- \"@pkg/name\"`)."
-            )
+    # Most frontmatter has no `@` at all, so one substring probe settles the common case.
+    if "@" not in frontmatter_text:
+        return
+    if any(_YAML_AT_RE.match(line) for line in frontmatter_text.splitlines()):
+        result.add_error(
+            "YAML frontmatter safety rule violated: quote trigger/scalar values starting with `@` (use `- \"@pkg/name\"`)."
+        )
 
 
 def _validate_top_level_layout(skill_dir: Path, result: VerificationResult) -> None:
@@ -233,55 +295,6 @@ def _validate_top_level_layout(skill_dir: Path, result: VerificationResult) -> N
                 )
 
 
-def _validate_name_spec(value: Any, parent_dir_name: str, result: VerificationResult) -> None:
-    if not isinstance(value, str):
-        result.add_spec_error("Frontmatter field `name` is required and must be a string.")
-        return
-    if len(value) == 0 or len(value) > 64:
-        result.add_spec_error("`name` must be 1-64 characters.")
-    if not NAME_RE.fullmatch(value):
-        result.add_spec_error(
-            "`name` must contain only lowercase letters, numbers, and hyphens."
-        )
-    if value.startswith("-") or value.endswith("-"):
-        result.add_spec_error("`name` must not start or end with `-`.")
-    if "--" in value:
-        result.add_spec_error("`name` must not contain consecutive hyphens (`--`).")
-    if value != parent_dir_name:
-        result.add_spec_error(
-            f"`name` ({value}) must match the parent directory name ({parent_dir_name})."
-        )
-
-
-def _validate_description_spec(value: Any, result: VerificationResult) -> None:
-    if not isinstance(value, str):
-        result.add_spec_error("Frontmatter field `description` is required and must be a string.")
-        return
-    length = len(value.strip())
-    if length == 0 or length > 1024:
-        result.add_spec_error("`description` must be non-empty and at most 1024 characters.")
-    elif length < 20:
-        result.add_spec_warning(
-            "`description` is very short; include what the skill does and when to use it."
-        )
-
-
-def _validate_optional_string_field_spec(
-    key: str, value: Any, result: VerificationResult, max_len: int | None = None
-) -> None:
-    if value is None:
-        return
-    if not isinstance(value, str):
-        result.add_spec_error(f"`{key}` must be a string if provided.")
-        return
-    trimmed = value.strip()
-    if key == "compatibility" and len(trimmed) == 0:
-        result.add_spec_error("`compatibility` must be 1-500 characters if provided.")
-        return
-    if max_len is not None and len(trimmed) > max_len:
-        result.add_spec_error(f"`{key}` must be at most {max_len} characters.")
-
-
 def _is_non_empty_string_list(value: Any) -> bool:
     return isinstance(value, list) and len(value) > 0 and all(
         isinstance(x, str) and x.strip() for x in value
@@ -309,6 +322,13 @@ def _validate_activation(frontmatter: dict[str, Any], result: VerificationResult
         result.add_error("Workflow gate: `activation.priority` must be `normal` or `high`.")
 
 
+def _has_digit(value: str) -> bool:
+    # Same answer as re.search(r"\d", value); the isdecimal() scan only runs for non-ASCII text.
+    if not _DIGITS.isdisjoint(value):
+        return True
+    return not value.isascii() and any(c.isdecimal() for c in value)
+
+
 def _validate_version_and_compatibility(frontmatter: dict[str, Any], result: VerificationResult) -> None:
     metadata = frontmatter.get("metadata")
     compatibility = frontmatter.get("compatibility")
@@ -327,10 +347,10 @@ def _validate_version_and_compatibility(frontmatter: dict[str, Any], result: Ver
     if isinstance(metadata, dict):
         for k, v in metadata.items():
             if isinstance(k, str) and "version" in k.lower() and isinstance(v, str) and v.strip():
-                if re.search(r"\d", v):
+                if _has_digit(v):
                     version_pinned = True
                     break
-    if not version_pinned and isinstance(compatibility, str) and re.search(r"\d", compatibility):
+    if not version_pinned and isinstance(compatibility, str) and _has_digit(compatibility):
         version_pinned = True
 
     if not version_pinned:
@@ -339,23 +359,75 @@ def _validate_version_and_compatibility(frontmatter: dict[str, Any], result: Ver
         )
 
 
-def _validate_references_taxonomy_and_sizes(skill_dir: Path, frontmatter: dict[str, Any], result: VerificationResult) -> None:
+def _count_lines(path: Path) -> int | None:
+    # Same count as len(path.read_text(encoding="utf-8").splitlines()), streamed in chunks.
+    # Returns None when the file is not valid UTF-8.
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    breaks = 0
+    last = ""
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(1 << 16)
+            try:
+                text = decoder.decode(chunk, final=not chunk)
+            except UnicodeDecodeError:
+                return None
+            if text:
+                breaks += text.count("\n") + text.count("\r") - text.count("\r\n")
+                if last == "\r" and text[0] == "\n":
+                    breaks -= 1  # \r\n split across two chunks
+                if _OTHER_LINE_BREAKS_RE.search(text):
+                    breaks += len(_OTHER_LINE_BREAKS_RE.findall(text))
+                last = text[-1]
+            if not chunk:
+                break
+    return breaks + (1 if last and last not in _LINE_BREAK_CHARS else 0)
+
+
+def _walk_references(references_dir: Path) -> list[Path]:
+    # One os.scandir pass; DirEntry caches d_type, so regular entries need no extra stat().
+    # Mirrors rglob("*") + is_file(): symlinked files count, symlinked dirs are not descended.
+    files: list[Path] = []
+    pending = [os.fspath(references_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    files.append(Path(entry.path))
+    files.sort()
+    return files
+
+
+def _ref_parts(ref: str) -> list[str]:
+    # Path(ref).parts for a relative ref without building a Path: empty and `.` segments drop out.
+    if os.altsep:
+        ref = ref.replace(os.altsep, os.sep)
+    return [part for part in ref.split(os.sep) if part and part != "."]
+
+
+def _validate_references_taxonomy_and_sizes(
+    skill_dir: Path, frontmatter: dict[str, Any], result: VerificationResult
+) -> dict[Path, int | None]:
+    """Run the references checks; return the line count (None if not UTF-8) of each markdown file."""
     references_dir = skill_dir / "references"
     refs_field = frontmatter.get("references")
 
     if _is_non_empty_string_list(refs_field) and not references_dir.exists():
         result.add_error("Workflow gate: `references` field is present but `references/` directory is missing.")
-        return
+        return {}
 
     if not references_dir.exists():
-        return
+        return {}
 
     if not references_dir.is_dir():
         result.add_error("`references` must be a directory when present.")
-        return
+        return {}
 
-    reference_files = sorted([p for p in references_dir.rglob("*") if p.is_file()])
+    reference_files = _walk_references(references_dir)
     md_reference_files = [p for p in reference_files if p.suffix.lower() == ".md"]
+    line_counts = {p: _count_lines(p) for p in md_reference_files}
 
     # Deterministic taxonomy: all reference docs should live under references/<category>/...
     for ref_file in md_reference_files:
@@ -368,14 +440,12 @@ def _validate_references_taxonomy_and_sizes(skill_dir: Path, frontmatter: dict[s
             continue
         category = parts[1]
         if category not in WORKFLOW_REFERENCE_TAXONOMY:
-            allowed = ", ".join(sorted(WORKFLOW_REFERENCE_TAXONOMY))
             result.add_error(
-                f"Workflow gate: invalid reference category `{category}` in `{rel.as_posix()}`. Allowed: {allowed}."
+                f"Workflow gate: invalid reference category `{category}` in `{rel.as_posix()}`. Allowed: {_WORKFLOW_REFERENCE_TAXONOMY_ALLOWED}."
             )
 
-        try:
-            line_count = len(ref_file.read_text(encoding="utf-8").splitlines())
-        except UnicodeDecodeError:
+        line_count = line_counts[ref_file]
+        if line_count is None:
             result.add_error(f"Reference file must be UTF-8 decodable: `{rel.as_posix()}`")
             continue
         if line_count > 800:
@@ -385,13 +455,21 @@ def _validate_references_taxonomy_and_sizes(skill_dir: Path, frontmatter: dict[s
 
     # Also validate listed references point to markdown files in taxonomy and exist (errors already partly covered).
     if isinstance(refs_field, list):
+        # Entries found by the walk need no stat(); anything else (`..`, symlinked dirs, files
+        # outside references/) still goes to the filesystem.
+        skill_dir_str = os.fspath(skill_dir)
+        existing_files = {os.fspath(p) for p in reference_files}
         for ref in refs_field:
             if not isinstance(ref, str) or not ref.strip():
                 continue
-            ref_path = Path(ref)
-            resolved = skill_dir / ref_path
-            if resolved.exists() and resolved.is_file():
-                parts = ref_path.parts
+            is_absolute = os.path.isabs(ref)
+            parts = _ref_parts(ref)
+            if (
+                not is_absolute and os.path.join(skill_dir_str, *parts) in existing_files
+            ) or (skill_dir / ref).is_file():
+                if is_absolute:
+                    # Path(ref).parts would start with the root, which is never "references".
+                    parts = []
                 if len(parts) < 3 or parts[0] != "references":
                     result.add_error(
                         f"Workflow gate: `references` entries must use taxonomy paths under `references/<category>/...`, got `{ref}`."
@@ -402,28 +480,45 @@ def _validate_references_taxonomy_and_sizes(skill_dir: Path, frontmatter: dict[s
                     )
 
     # Fragmentation guard (warning): many micro-files suggests over-splitting.
-    micro_files = []
-    for ref_file in md_reference_files:
-        try:
-            line_count = len(ref_file.read_text(encoding="utf-8").splitlines())
-        except UnicodeDecodeError:
-            continue
-        if line_count < 100:
-            micro_files.append((ref_file, line_count))
-    if len(md_reference_files) >= 5 and len(micro_files) >= max(3, len(md_reference_files) // 2):
+    micro_files = sum(1 for count in line_counts.values() if count is not None and count < 100)
+    if len(md_reference_files) >= 5 and micro_files >= max(3, len(md_reference_files) // 2):
         result.add_warning(
             "Workflow gate: many reference files are under 100 lines. Check fragmentation guard and merge semantically related files where possible."
         )
+    return line_counts
 
 
-def _validate_brain_only_guidance(skill_md_text: str, result: VerificationResult, references_total_lines: int | None = None) -> None:
-    lines = skill_md_text.splitlines()
+def _validate_brain_only_guidance(
+    skill_md_text: str,
+    result: VerificationResult,
+    references_total_lines: int | None = None,
+    lines: list[str] | None = None,
+) -> None:
+    if lines is None:
+        lines = skill_md_text.splitlines()
+    # The example-heading check rides along on the fence loop for plain \n text; line splitting
+    # only matches the old `(?im)^#{1,6}\s+.*example` search when \n is the sole line break.
+    scan_headings = "\r" not in skill_md_text and not _has_other_line_breaks(skill_md_text)
+    has_example_heading = False
+    heading_pending = False
     in_code = False
     code_lines = 0
     code_blocks = 0
     current_block_lines = 0
     max_block_lines = 0
     for line in lines:
+        if scan_headings and not has_example_heading:
+            if heading_pending and line and not line.isspace():
+                # A heading with nothing after the hashes: `\s+` runs on to the next non-blank line.
+                has_example_heading = "example" in line.lower()
+                heading_pending = False
+            if not has_example_heading and line.startswith("#"):
+                rest = line.lstrip("#")
+                if len(line) - len(rest) <= 6:
+                    if not rest or rest.isspace():
+                        heading_pending = True
+                    elif rest[0].isspace():
+                        has_example_heading = "example" in rest.lower()
         if line.strip().startswith("```"):
             if not in_code:
                 in_code = True
@@ -440,7 +535,9 @@ def _validate_brain_only_guidance(skill_md_text: str, result: VerificationResult
         max_block_lines = max(max_block_lines, current_block_lines)
         result.add_warning("SKILL.md contains an unclosed fenced code block.")
 
-    if re.search(r"(?im)^#{1,6}\s+.*example", skill_md_text):
+    if not scan_headings:
+        has_example_heading = re.search(r"(?im)^#{1,6}\s+.*example", skill_md_text) is not None
+    if has_example_heading:
         result.add_warning(
             "Workflow gate: SKILL.md appears to contain example sections. Move examples into `references/` files."
         )
@@ -476,18 +573,17 @@ def _validate_custom_frontmatter_conventions(frontmatter: dict[str, Any], skill_
             )
             return
         for ref in refs:
-            ref_path = Path(ref)
-            if ref_path.is_absolute():
+            if os.path.isabs(ref):
                 result.add_error(
                     f"`references` entry must be relative to the skill root, got absolute path: {ref}"
                 )
                 continue
-            if ".." in ref_path.parts:
+            if ".." in _ref_parts(ref):
                 result.add_error(
                     f"`references` entry must not traverse outside the skill root: {ref}"
                 )
                 continue
-            if not (skill_dir / ref_path).exists():
+            if not (skill_dir / ref).exists():
                 result.add_error(f"`references` entry not found: {ref}")
     else:
         result.add_error("Workflow gate: `references` field is required in SKILL.md frontmatter.")
@@ -496,19 +592,6 @@ def _validate_custom_frontmatter_conventions(frontmatter: dict[str, Any], skill_
     _validate_version_and_compatibility(frontmatter, result)
 
 
-def _run_spec_validation(parsed: dict[str, Any], skill_dir: Path, body: str | None, result: VerificationResult) -> None:
-    _validate_name_spec(parsed.get("name"), skill_dir.name, result)
-    _validate_description_spec(parsed.get("description"), result)
-    _validate_optional_string_field_spec("license", parsed.get("license"), result)
-    _validate_optional_string_field_spec(
-        "compatibility", parsed.get("compatibility"), result, max_len=500
-    )
-    _validate_metadata_spec(parsed.get("metadata"), result)
-    _validate_allowed_tools_spec(parsed.get("allowed-tools"), result)
-    if body is None or not body.strip():
-        result.add_spec_warning("SKILL.md has no Markdown body after frontmatter.")
-
-
 def _calc_grade(errors: int, warnings: int, *, error_weight: int, warning_weight: int) -> int:
     score = 100 - (errors * error_weight) - (warnings * warning_weight)
     if score < 0:
@@ -520,18 +603,18 @@ def _calc_grade(errors: int, warnings: int, *, error_weight: int, warning_weight
 
 def _finalize_grades(result: VerificationResult) -> None:
     result.spec_grade = _calc_grade(
-        len(result.spec_errors),
-        len(result.spec_warnings),
+        result._spec_error_count,
+        result._spec_warning_count,
         error_weight=25,
         warning_weight=4,
     )
     result.strict_grade = _calc_grade(
-        len(result.errors),
-        len(result.warnings),
+        result._error_count,
+        result._warning_count,
         error_weight=15,
         warning_weight=3,
     )
-    result.spec_passed = len(result.spec_errors) == 0
+    result.spec_passed = result._spec_error_count == 0
     result.strict_passed = result.spec_passed and result.strict_grade >= result.strict_threshold
 
 
@@ -540,15 +623,13 @@ def verify_skill_directory(skill_dir: str | Path) -> VerificationResult:
     result = VerificationResult(skill_dir=skill_dir, skill_md_path=skill_dir / "SKILL.md")
 
     if not skill_dir.exists() or not skill_dir.is_dir():
-        result.add_error(f"Skill path is not a directory: {skill_dir}")
-        result.add_spec_error(f"Skill path is not a directory: {skill_dir}")
+        result.add_shared_error(f"Skill path is not a directory: {skill_dir}")
         _finalize_grades(result)
         return result
 
     skill_md = result.skill_md_path
     if not skill_md.exists():
-        result.add_error(f"Missing required file: {skill_md.name}")
-        result.add_spec_error(f"Missing required file: {skill_md.name}")
+        result.add_shared_error(f"Missing required file: {skill_md.name}")
         _finalize_grades(result)
         return result
 
@@ -558,20 +639,17 @@ def verify_skill_directory(skill_dir: str | Path) -> VerificationResult:
     try:
         text = skill_md.read_text(encoding="utf-8")
     except UnicodeDecodeError:
-        result.add_error("SKILL.md must be UTF-8 decodable text.")
-        result.add_spec_error("SKILL.md must be UTF-8 decodable text.")
+        result.add_shared_error("SKILL.md must be UTF-8 decodable text.")
         _finalize_grades(result)
         return result
     except OSError as exc:
-        result.add_error(f"Unable to read SKILL.md: {exc}")
-        result.add_spec_error(f"Unable to read SKILL.md: {exc}")
+        result.add_shared_error(f"Unable to read SKILL.md: {exc}")
         _finalize_grades(result)
         return result
 
     split = _split_frontmatter(text)
     if split is None:
-        result.add_error("SKILL.md must start with YAML frontmatter delimited by `---`.")
-        result.add_spec_error("SKILL.md must start with YAML frontmatter delimited by `---`.")
+        result.add_shared_error("SKILL.md must start with YAML frontmatter delimited by `---`.")
         _finalize_grades(result)
         return result
 
@@ -580,16 +658,18 @@ def verify_skill_directory(skill_dir: str | Path) -> VerificationResult:
     _validate_yaml_frontmatter_safety(frontmatter_text, result)
 
     try:
-        parsed = yaml.safe_load(frontmatter_text) if frontmatter_text.strip() else None
+        parsed = (
+            _load_yaml(frontmatter_text)
+            if frontmatter_text and not frontmatter_text.isspace()
+            else None
+        )
     except yaml.YAMLError as exc:
-        result.add_error(f"Invalid YAML frontmatter in SKILL.md: {exc}")
-        result.add_spec_error(f"Invalid YAML frontmatter in SKILL.md: {exc}")
+        result.add_shared_error(f"Invalid YAML frontmatter in SKILL.md: {exc}")
         _finalize_grades(result)
         return result
 
     if not isinstance(parsed, dict):
-        result.add_error("SKILL.md frontmatter must be a YAML mapping/object.")
-        result.add_spec_error("SKILL.md frontmatter must be a YAML mapping/object.")
+        result.add_shared_error("SKILL.md frontmatter must be a YAML mapping/object.")
         _finalize_grades(result)
         return result
 
@@ -604,24 +684,24 @@ def verify_skill_directory(skill_dir: str | Path) -> VerificationResult:
     _validate_metadata(parsed.get("metadata"), result)
     _validate_allowed_tools(parsed.get("allowed-tools"), result)
     _validate_custom_frontmatter_conventions(parsed, skill_dir, result)
-    _validate_references_taxonomy_and_sizes(skill_dir, parsed, result)
-    _run_spec_validation(parsed, skill_dir, result.body, result)
+    reference_line_counts = _validate_references_taxonomy_and_sizes(skill_dir, parsed, result)
 
-    if result.body is None or not result.body.strip():
-        result.add_warning("SKILL.md has no Markdown body after frontmatter.")
+    if not result.body or result.body.isspace():
+        result.add_shared_warning("SKILL.md has no Markdown body after frontmatter.")
 
     skill_md_lines = text.splitlines()
     if len(skill_md_lines) > 500:
         result.add_warning(
             f"SKILL.md has {len(skill_md_lines)} lines; Agent Skills recommends keeping it under 500 lines."
         )
-    references_total_lines = 0
-    for ref_file in (skill_dir / "references").rglob("*.md") if (skill_dir / "references").exists() else []:
-        try:
-            references_total_lines += len(ref_file.read_text(encoding="utf-8").splitlines())
-        except UnicodeDecodeError:
-            continue
-    _validate_brain_only_guidance(text, result, references_total_lines if references_total_lines else None)
+    # Reuses the counts from the references pass (its `*.md` match is case-insensitive, this one is not).
+    references_total_lines = sum(
+        count for ref_file, count in reference_line_counts.items()
+        if count is not None and ref_file.suffix == ".md"
+    )
+    _validate_brain_only_guidance(
+        text, result, references_total_lines if references_total_lines else None, skill_md_lines
+    )
     _finalize_grades(result)
 
     return result
@@ -637,19 +717,21 @@ def format_verification_report(result: VerificationResult) -> str:
         f"[verify] STRICT grade={result.strict_grade}/100 status={'PASS' if result.strict_passed else 'FAIL'} threshold={result.strict_threshold}"
     )
 
-    if result.spec_issues:
-        lines.append("[verify] Spec Findings")
-        for issue in result.spec_errors:
-            lines.append(f"  SPEC ERROR: {issue.message}")
-        for issue in result.spec_warnings:
-            lines.append(f"  SPEC WARN: {issue.message}")
-
-    if result.issues:
-        lines.append("[verify] Strict Findings")
-        for issue in result.errors:
-            lines.append(f"  STRICT ERROR: {issue.message}")
-        for issue in result.warnings:
-            lines.append(f"  STRICT WARN: {issue.message}")
+    for title, scope, issues in (
+        ("Spec Findings", "SPEC", result.spec_issues),
+        ("Strict Findings", "STRICT", result.issues),
+    ):
+        if not issues:
+            continue
+        lines.append(f"[verify] {title}")
+        # One pass over the issues; errors still print before warnings.
+        warn_lines: list[str] = []
+        for issue in issues:
+            if issue.level == _LVL_ERROR:
+                lines.append(f"  {scope} ERROR: {issue.message}")
+            elif issue.level == _LVL_WARNING:
+                warn_lines.append(f"  {scope} WARN: {issue.message}")
+        lines.extend(warn_lines)
     return "\n".join(lines)
 
 